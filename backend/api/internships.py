@@ -3,13 +3,16 @@ Internships API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional, List
+from sqlalchemy.orm import contains_eager
 from sqlmodel import Session, select
 from backend.core.database import get_session
 from backend.data.models import FieldTag, Modality, Internship, Company, Source, ContactEmail
 from backend.data.schemas import (
     InternshipSearchParams,
     InternshipDetailResponse,
-    InternshipListResponse
+    InternshipFullResponse,
+    InternshipListResponse,
+    InternshipResponse
 )
 
 router = APIRouter()
@@ -38,7 +41,13 @@ async def search_internships(
     Returns paginated results with facet counts
     """
     # Build query
-    query = select(Internship).join(Company).join(Source)
+    # The joined company and source populate the relationships directly
+    query = (
+        select(Internship)
+        .join(Company)
+        .join(Source)
+        .options(contains_eager(Internship.company), contains_eager(Internship.source))
+    )
     
     # Apply filters
     if q:
@@ -63,13 +72,43 @@ async def search_internships(
     # Execute query
     internships = session.exec(query).all()
     
+    # Facet counts are placeholders until they are computed from the database
+    mock_facets = {
+        "fields": [
+            {"key": "software_engineering", "count": 150},
+            {"key": "data_science", "count": 80},
+            {"key": "product_management", "count": 45}
+        ],
+        "regions": [
+            {"key": "Ontario", "count": 200},
+            {"key": "British Columbia", "count": 120},
+            {"key": "Quebec", "count": 90}
+        ],
+        "cities": [
+            {"key": "Toronto", "count": 180},
+            {"key": "Vancouver", "count": 100},
+            {"key": "Montreal", "count": 85}
+        ],
+        "modalities": [
+            {"key": "hybrid", "count": 250},
+            {"key": "remote", "count": 180},
+            {"key": "on_site", "count": 120}
+        ],
+        "sources": [
+            {"key": "job_bank_ca", "count": 300},
+            {"key": "indeed_ca", "count": 200},
+            {"key": "talent_com", "count": 150}
+        ],
+        "government_programs": 45
+    }
+    
     # If no results, return multiple mock internships for demo
     if not internships:
         mock_internships = [
             {
                 "id": 1,
                 "title": "Software Engineering Intern",
-                "description": "Build scalable e-commerce solutions used by millions of merchants worldwide. Work with React, Ruby on Rails, and GraphQL. You'll collaborate with senior developers on real-world projects that impact millions of users.",
+                "description_snippet": "Build scalable e-commerce solutions used by millions of merchants worldwide. Work with React, Ruby on Rails, and GraphQL. You'll collaborate with senior developers on real-world projects that impact millions of users.",
                 "field_tag": "software_engineering",
                 "city": "Toronto",
                 "region": "Ontario",
@@ -110,7 +149,7 @@ async def search_internships(
             {
                 "id": 2,
                 "title": "Data Science Intern",
-                "description": "Join our AI/ML team to build recommendation systems and analyze user behavior patterns. Work with Python, TensorFlow, and large datasets to drive business insights.",
+                "description_snippet": "Join our AI/ML team to build recommendation systems and analyze user behavior patterns. Work with Python, TensorFlow, and large datasets to drive business insights.",
                 "field_tag": "data_science",
                 "city": "Vancouver",
                 "region": "British Columbia",
@@ -151,7 +190,7 @@ async def search_internships(
             {
                 "id": 3,
                 "title": "Product Management Intern",
-                "description": "Support product managers in defining roadmaps, conducting user research, and analyzing market trends. Perfect for students interested in tech product strategy.",
+                "description_snippet": "Support product managers in defining roadmaps, conducting user research, and analyzing market trends. Perfect for students interested in tech product strategy.",
                 "field_tag": "product_management",
                 "city": "Montreal",
                 "region": "Quebec",
@@ -192,7 +231,7 @@ async def search_internships(
             {
                 "id": 4,
                 "title": "UX/UI Design Intern",
-                "description": "Create beautiful and intuitive user interfaces for mobile and web applications. Work closely with designers and developers to bring concepts to life.",
+                "description_snippet": "Create beautiful and intuitive user interfaces for mobile and web applications. Work closely with designers and developers to bring concepts to life.",
                 "field_tag": "design_ux_ui",
                 "city": "Calgary",
                 "region": "Alberta",
@@ -233,7 +272,7 @@ async def search_internships(
             {
                 "id": 5,
                 "title": "Marketing Analytics Intern",
-                "description": "Analyze marketing campaigns, track user engagement metrics, and create data-driven recommendations to optimize marketing spend and ROI.",
+                "description_snippet": "Analyze marketing campaigns, track user engagement metrics, and create data-driven recommendations to optimize marketing spend and ROI.",
                 "field_tag": "marketing",
                 "city": "Ottawa",
                 "region": "Ontario",
@@ -273,35 +312,6 @@ async def search_internships(
             }
         ]
         
-        mock_facets = {
-            "fields": [
-                {"key": "software_engineering", "count": 150},
-                {"key": "data_science", "count": 80},
-                {"key": "product_management", "count": 45}
-            ],
-            "regions": [
-                {"key": "Ontario", "count": 200},
-                {"key": "British Columbia", "count": 120},
-                {"key": "Quebec", "count": 90}
-            ],
-            "cities": [
-                {"key": "Toronto", "count": 180},
-                {"key": "Vancouver", "count": 100},
-                {"key": "Montreal", "count": 85}
-            ],
-            "modalities": [
-                {"key": "hybrid", "count": 250},
-                {"key": "remote", "count": 180},
-                {"key": "on_site", "count": 120}
-            ],
-            "sources": [
-                {"key": "job_bank_ca", "count": 300},
-                {"key": "indeed_ca", "count": 200},
-                {"key": "talent_com", "count": 150}
-            ],
-            "government_programs": 45
-        }
-        
         return InternshipListResponse(
             items=mock_internships,
             total=len(mock_internships),
@@ -313,7 +323,7 @@ async def search_internships(
     
     # Return actual database results if found
     return InternshipListResponse(
-        items=[internship.dict() for internship in internships],
+        items=[InternshipResponse.from_row(internship) for internship in internships],
         total=len(internships),
         page=page,
         page_size=page_size,
@@ -669,7 +679,7 @@ async def get_internship_detail(internship_id: int, session: Session = Depends(g
     # Return actual database result if found
     # TODO: Get actual contact emails from database
     return InternshipDetailResponse(
-        internship=internship.dict(),
+        internship=InternshipFullResponse.from_row(internship),
         contact_emails=[],  # TODO: Query actual contact emails
         is_bookmarked=False  # TODO: Check if user has bookmarked this
     )
@@ -2,7 +2,7 @@
 Resume API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from typing import Dict, List
 from sqlmodel import Session
 from backend.core.database import get_session
 from backend.data.models import Resume
@@ -88,7 +88,7 @@ async def update_resume(resume_id: int, resume_data: ResumeUpdate):
 
 
 @router.delete("/resumes/{resume_id}")
-async def delete_resume(resume_id: int):
+async def delete_resume(resume_id: int) -> Dict[str, str]:
     """Delete resume"""
     # TODO: Implement with database
     if resume_id != 1:
@@ -98,7 +98,7 @@ async def delete_resume(resume_id: int):
 
 
 @router.post("/resumes/{resume_id}/export")
-async def export_resume_pdf(resume_id: int):
+async def export_resume_pdf(resume_id: int) -> Dict[str, str]:
     """Generate and export resume as PDF"""
     # TODO: Implement with Playwright PDF generation
     if resume_id != 1:
@@ -2,7 +2,7 @@
 Users API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from typing import Dict, List
 from sqlmodel import Session
 from backend.core.database import get_session
 from backend.data.models import User, Bookmark
@@ -64,13 +64,13 @@ async def create_bookmark(bookmark_data: BookmarkCreate):
     """Bookmark an internship"""
     # TODO: Implement with database
     mock_bookmark = {
-        "id": 1,
+        "internship_id": bookmark_data.internship_id,
         "notes": bookmark_data.notes,
         "created_at": "2024-01-15T10:00:00Z",
         "internship": {
             "id": bookmark_data.internship_id,
             "title": "Software Engineering Intern",
-            "description": "Build scalable solutions",
+            "description_snippet": "Build scalable solutions",
             "field_tag": "software_engineering",
             "city": "Toronto",
             "region": "Ontario",
@@ -112,11 +112,17 @@ async def create_bookmark(bookmark_data: BookmarkCreate):
     return BookmarkResponse(**mock_bookmark)
 
 
-@router.delete("/bookmarks/{bookmark_id}")
-async def delete_bookmark(bookmark_id: int):
-    """Remove bookmark"""
-    # TODO: Implement with database
-    if bookmark_id != 1:
+@router.delete("/bookmarks/{internship_id}")
+async def delete_bookmark(internship_id: int, session: Session = Depends(get_session)) -> Dict[str, str]:
+    """Remove the current user's bookmark of an internship"""
+    # TODO: Use the Supabase-authenticated user
+    user_id = 1
+    
+    # Bookmarks are keyed by (user_id, internship_id)
+    bookmark = session.get(Bookmark, (user_id, internship_id))
+    if not bookmark:
         raise HTTPException(status_code=404, detail="Bookmark not found")
     
+    session.delete(bookmark)
+    session.commit()
     return {"message": "Bookmark removed successfully"}
@@ -4,10 +4,12 @@
 from . import auth
 from . import internships
 from . import ranking
+from . import resumes
 
 # List of all available endpoint modules
 __all__ = [
     "auth",
     "internships",
     "ranking",
+    "resumes",
 ]
@@ -0,0 +1,63 @@
+from typing import Any, Iterator, List
+from uuid import UUID
+
+import orjson
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+
+from app.api import deps
+from app.db.session import SessionLocal
+from app.models.resume import Resume, ResumePublic
+from app.models.user import User
+
+router = APIRouter()
+
+# Rows fetched from the cursor per round-trip while streaming
+STREAM_BATCH_SIZE = 100
+
+def _iter_resumes_json(user_id: UUID) -> Iterator[bytes]:
+    """Yield a JSON array of the user's resumes one row at a time"""
+    # The request-scoped session may be closed before the body is sent,
+    # so the stream owns its own session.
+    db = SessionLocal()
+    try:
+        statement = (
+            select(Resume)
+            .where(
+                Resume.user_id == user_id,
+                Resume.is_deleted.is_(False),
+                Resume.deleted_at.is_(None),
+            )
+            .order_by(Resume.updated_at.desc())
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        yield b"["
+        for index, resume in enumerate(db.execute(statement).scalars()):
+            if index:
+                yield b","
+            # Rows come straight from the database, so skip re-validation
+            public = ResumePublic.model_construct(**{
+                name: getattr(resume, name)
+                for name in ResumePublic.model_fields
+                if hasattr(resume, name)
+            })
+            yield orjson.dumps(public.model_dump())
+        yield b"]"
+    finally:
+        db.close()
+
+@router.get("/", response_model=List[ResumePublic])
+def read_resumes(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the current user's resumes, most recently updated first.
+
+    The body is streamed so memory stays flat regardless of how many
+    resume versions the user has.
+    """
+    return StreamingResponse(
+        _iter_resumes_json(current_user.id),
+        media_type="application/json",
+    )
@@ -1,5 +1,8 @@
-from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import lru_cache
+import orjson
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode
+from typing import Annotated, List, Optional, Union
 import os
 from pathlib import Path
 
@@ -16,8 +19,8 @@ class Settings(BaseSettings):
     SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
     SERVER_PORT: int = int(os.getenv("PORT", "8000"))
     
-    # CORS
-    BACKEND_CORS_ORIGINS: list[str] = ["*"]
+    # CORS (a JSON list, or a comma-separated string split once by the validator below)
+    BACKEND_CORS_ORIGINS: Annotated[list[str], NoDecode] = ["*"]
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./sql_app.db")
@@ -42,7 +45,9 @@ class Settings(BaseSettings):
     
     # Scraping
     SCRAPER_USER_AGENT: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
-    SCRAPER_TIMEOUT: int = 30
+    SCRAPER_TIMEOUT: int = 30  # seconds per scraper HTTP request
+    SCRAPER_RUN_BUDGET: Optional[int] = None  # cap in seconds on one scraper's run in scrape_all (default: derived from its rate limit)
+    SCRAPER_MAX_CONCURRENCY: int = 4  # scrapers run at once by scrape_all
     
     # Paths
     BASE_DIR: Path = Path(__file__).resolve().parent.parent
@@ -56,8 +61,23 @@ class Settings(BaseSettings):
     AGGREGATOR_LOCATION: str = os.getenv("AGGREGATOR_LOCATION", "Canada")
     AGGREGATOR_MAX_RESULTS: int = int(os.getenv("AGGREGATOR_MAX_RESULTS", "1500"))
     
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
+    def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
+        if isinstance(v, str):
+            if v.startswith("["):
+                return orjson.loads(v)
+            return [i.strip() for i in v.split(",")]
+        return v
+    
     class Config:
         case_sensitive = True
         env_file = ".env"
-        
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once"""
+    return Settings()
+
+# Module-level alias for existing `from app.core.config import settings` imports
+settings = get_settings()
@@ -5,16 +5,19 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from typing import Generator, AsyncGenerator
 
 from app.core.config import settings
+from app.db.serialization import json_deserializer
 
 # Create SQLAlchemy engines
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
+    json_deserializer=json_deserializer,
 )
 
 async_engine = create_async_engine(
     settings.ASYNC_DATABASE_URL,
     echo=settings.SQL_ECHO,
+    json_deserializer=json_deserializer,
 )
 
 # Create session factories
@@ -147,6 +147,38 @@ class CRUDBookmark(CRUDBase[Bookmark, BookmarkCreate, BookmarkUpdate]):
         
         return db.execute(query).unique().scalar_one_or_none()
     
+    def build(
+        self,
+        *,
+        obj_in: BookmarkCreate,
+        user_id: UUID,
+        **kwargs
+    ) -> Bookmark:
+        """
+        Build a new, unsaved bookmark with any reminder set up.
+        
+        Args:
+            obj_in: Bookmark data
+            user_id: ID of the user creating the bookmark
+            **kwargs: Additional fields to set on the bookmark
+            
+        Returns:
+            The bookmark, not yet added to a session
+        """
+        # Convert Pydantic model to dict and add user_id
+        create_data = obj_in.dict(exclude_unset=True)
+        create_data.update({
+            'user_id': user_id,
+            **kwargs
+        })
+        
+        # Set reminder if remind_in_days is provided
+        if 'remind_in_days' in create_data and create_data['remind_in_days']:
+            remind_in_days = create_data.pop('remind_in_days')
+            create_data['remind_at'] = datetime.utcnow() + timedelta(days=remind_in_days)
+        
+        return Bookmark(**create_data)
+    
     def create_with_activity(
         self, 
         db: Session, 
@@ -168,20 +200,8 @@ class CRUDBookmark(CRUDBase[Bookmark, BookmarkCreate, BookmarkUpdate]):
             The created bookmark
         """
         try:
-            # Convert Pydantic model to dict and add user_id
-            create_data = obj_in.dict(exclude_unset=True)
-            create_data.update({
-                'user_id': user_id,
-                **kwargs
-            })
-            
-            # Set reminder if remind_in_days is provided
-            if 'remind_in_days' in create_data and create_data['remind_in_days']:
-                remind_in_days = create_data.pop('remind_in_days')
-                create_data['remind_at'] = datetime.utcnow() + timedelta(days=remind_in_days)
-            
             # Create the bookmark
-            db_obj = Bookmark(**create_data)
+            db_obj = self.build(obj_in=obj_in, user_id=user_id, **kwargs)
             
             db.add(db_obj)
             db.commit()
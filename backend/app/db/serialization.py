@@ -0,0 +1,7 @@
+from typing import Any
+
+import orjson
+
+def json_deserializer(raw: Any) -> Any:
+    """Decode JSON/JSONB column values with orjson (which already caches repeated short keys)"""
+    return orjson.loads(raw)
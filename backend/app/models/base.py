@@ -119,6 +119,9 @@ class AuditMixin(SQLModel):
     updated_by: Optional[UUID] = None
     deleted_by: Optional[UUID] = None
 
+class AuditedBase(TimestampMixin, SoftDeleteMixin, AuditMixin):
+    """Timestamp, soft-delete and audit columns as a single base for table models"""
+
 # Common model configurations
 class ConfigMixin:
     @classmethod
@@ -1,17 +1,16 @@
-from typing import Optional, List, Dict, Any, TYPE_CHECKING, Union
+from typing import Optional, List, Dict, Any, TYPE_CHECKING, Union, Tuple, Annotated
+from annotated_types import BaseMetadata
 from sqlmodel import SQLModel, Field, Relationship, Column
-from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TSVECTOR
-from pydantic import validator, HttpUrl, EmailStr, constr, conlist
+from sqlalchemy import String, Computed, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from pydantic import validator, HttpUrl, EmailStr, constr, conlist, create_model
 from uuid import UUID, uuid4
 from datetime import datetime, date
 from enum import Enum
 
 from .base import (
-    BaseModel,
-    TimestampMixin,
-    SoftDeleteMixin,
-    AuditMixin,
-    ConfigMixin
+    AuditedBase,
+    ConfigMixin,
 )
 
 if TYPE_CHECKING:
@@ -77,6 +76,9 @@ class EducationType(str, Enum):
     COURSE = "course"
     SELF_STUDY = "self_study"
 
+# SQL expression backing the generated ``resumes.slug`` column
+RESUME_SLUG_EXPRESSION = "lower(regexp_replace(title, '[^a-zA-Z0-9]+', '-', 'g'))"
+
 class ResumeBase(SQLModel):
     """Base model for resume with all fields and validation"""
     # Core Metadata
@@ -218,19 +220,19 @@ class ResumeBase(SQLModel):
     )
     target_roles: List[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String)),
+        sa_column=Column(JSONB),
         description="Target job roles/positions"
     )
     target_industries: List[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String)),
+        sa_column=Column(JSONB),
         description="Target industries"
     )
     
     # SEO and Discoverability
     seo_keywords: List[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String)),
+        sa_column=Column(JSONB),
         description="Keywords for search optimization"
     )
     
@@ -262,8 +264,23 @@ class ResumeBase(SQLModel):
                 raise ValueError("Skills must have a 'name' field")
         return v
 
-class Resume(ResumeBase, BaseModel, TimestampMixin, SoftDeleteMixin, AuditMixin, table=True):
+class Resume(ResumeBase, AuditedBase, table=True):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Containment filters such as target_roles @> '["Data Analyst"]'
+        Index("idx_resumes_target_roles", "target_roles", postgresql_using="gin"),
+        Index("idx_resumes_target_industries", "target_industries", postgresql_using="gin"),
+        # Covers the per-user resume list (filter by status, newest first)
+        # without heap fetches; soft-deleted rows are left out.
+        Index(
+            "resumes_user_status_updated_idx",
+            "user_id",
+            "status",
+            text("updated_at DESC"),
+            postgresql_include=["title", "slug", "version"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
     
     # Database fields
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
@@ -273,10 +290,15 @@ class Resume(ResumeBase, BaseModel, TimestampMixin, SoftDeleteMixin, AuditMixin,
         default=1,
         description="Version number of the resume"
     )
-    slug: str = Field(
+    # Generated by the database from ``title`` so writes never slugify in Python
+    slug: Optional[str] = Field(
         default=None,
-        index=True,
-        nullable=False,
+        sa_column=Column(
+            String,
+            Computed(RESUME_SLUG_EXPRESSION, persisted=True),
+            index=True,
+            nullable=False,
+        ),
         description="URL-friendly version of the resume title"
     )
     
@@ -352,127 +374,47 @@ class ResumeCreate(ResumeBase):
             }
         }
 
-class ResumeUpdate(SQLModel):
-    """Schema for updating an existing resume"""
-    # Core Metadata
-    title: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="Title/name of this resume version"
-    )
-    template: Optional[ResumeTemplate] = Field(
-        default=None,
-        description="Template design to use for this resume"
-    )
-    status: Optional[ResumeStatus] = Field(
-        default=None,
-        description="Current status of the resume"
-    )
-    
-    # Personal Information
-    full_name: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="Full legal name for the resume"
-    )
-    professional_title: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="Professional title/headline"
-    )
-    email: Optional[EmailStr] = Field(
-        default=None,
-        description="Professional email address"
-    )
-    phone: Optional[constr(max_length=25)] = Field(
-        default=None,
-        description="Contact phone number with country code"
-    )
-    website: Optional[HttpUrl] = Field(
-        default=None,
-        description="Personal website or portfolio URL"
-    )
-    linkedin_url: Optional[HttpUrl] = Field(
-        default=None,
-        description="LinkedIn profile URL"
-    )
-    github_url: Optional[HttpUrl] = Field(
-        default=None,
-        description="GitHub profile URL"
-    )
-    location: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="City, Country format preferred"
-    )
-    preferred_contact: Optional[ContactMethod] = Field(
-        default=None,
-        description="Preferred method of contact"
-    )
-    
-    # Content Sections
-    summary: Optional[str] = Field(
-        default=None,
-        max_length=1000,
-        description="Professional summary/objective statement"
-    )
-    experience: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of work experiences with details"
-    )
-    education: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of education entries"
-    )
-    skills: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of skills with proficiency levels"
-    )
-    projects: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of relevant projects"
-    )
-    certifications: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of professional certifications"
-    )
-    languages: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="List of languages with proficiency levels"
-    )
-    custom_sections: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="Custom sections that don't fit standard categories"
-    )
-    
-    # Styling and Formatting
-    styles: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="CSS styles and formatting options"
-    )
-    
-    # Metadata
-    is_public: Optional[bool] = Field(
-        default=None,
-        description="Whether this resume is publicly accessible"
-    )
-    is_default: Optional[bool] = Field(
-        default=None,
-        description="Whether this is the user's default resume"
-    )
-    experience_level: Optional[ExperienceLevel] = Field(
-        default=None,
-        description="Target experience level for this resume"
-    )
-    target_roles: Optional[List[str]] = Field(
-        default=None,
-        description="Target job roles/positions"
-    )
-    target_industries: Optional[List[str]] = Field(
-        default=None,
-        description="Target industries"
-    )
-    
+# Fields a client may change after creation; ownership and SEO keywords are
+# managed server-side.
+RESUME_UPDATABLE_FIELDS = (
+    "title",
+    "template",
+    "status",
+    "full_name",
+    "professional_title",
+    "email",
+    "phone",
+    "website",
+    "linkedin_url",
+    "github_url",
+    "location",
+    "preferred_contact",
+    "summary",
+    "experience",
+    "education",
+    "skills",
+    "projects",
+    "certifications",
+    "languages",
+    "custom_sections",
+    "styles",
+    "is_public",
+    "is_default",
+    "experience_level",
+    "target_roles",
+    "target_industries",
+)
+
+def _optional_field(name: str) -> Tuple[Any, Any]:
+    """Derive an optional update field from the matching ``ResumeBase`` field"""
+    field = ResumeBase.model_fields[name]
+    constraints = [m for m in field.metadata if isinstance(m, BaseMetadata)]
+    annotation = Optional[field.annotation]
+    if constraints:
+        annotation = Annotated[(annotation, *constraints)]
+    return annotation, Field(default=None, description=field.description)
+
+class _ResumeUpdateBase(SQLModel):
     class Config:
         schema_extra = {
             "example": {
@@ -491,6 +433,13 @@ class ResumeUpdate(SQLModel):
             }
         }
 
+ResumeUpdate = create_model(
+    "ResumeUpdate",
+    __base__=_ResumeUpdateBase,
+    __doc__="Schema for updating an existing resume",
+    **{name: _optional_field(name) for name in RESUME_UPDATABLE_FIELDS},
+)
+
 class ResumePublic(ResumeBase):
     """Schema for public resume data"""
     id: UUID
@@ -501,11 +450,18 @@ class ResumePublic(ResumeBase):
     is_ats_friendly: bool = False
     word_count: int = 0
     
+    # Outbound data was validated on the way in; plain strings skip
+    # re-parsing emails and URLs on every response.
+    email: str
+    website: Optional[str] = None
+    linkedin_url: Optional[str] = None
+    github_url: Optional[str] = None
+    
     # URLs for generated assets
-    pdf_url: Optional[HttpUrl] = None
-    docx_url: Optional[HttpUrl] = None
-    thumbnail_url: Optional[HttpUrl] = None
-    share_url: Optional[HttpUrl] = None
+    pdf_url: Optional[str] = None
+    docx_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    share_url: Optional[str] = None
     
     # View counts (for public resumes)
     view_count: int = 0
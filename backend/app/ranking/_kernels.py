@@ -0,0 +1,226 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: fall back to vectorized NumPy
+    njit = None
+    prange = range
+
+# Column order of the score matrix returned by score_numeric
+RECENCY, SALARY, DEADLINE, COMPANY_RATING = range(4)
+
+# datetime64[us] NaT viewed as int64
+NAT = np.iinfo(np.int64).min
+US_PER_DAY = 86_400_000_000
+
+# Salary bands (upper bounds, inclusive) and the score of each band
+_SALARY_BINS = np.array([30000, 50000, 70000, 100000])
+_SALARY_LUT = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+
+# Days-until-deadline bands (upper bounds, inclusive) and their urgency;
+# anything more than a month out scores 0
+_DEADLINE_BINS = np.array([1, 3, 7, 14, 30])
+_DEADLINE_LUT = np.array([1.0, 0.8, 0.5, 0.3, 0.1, 0.0])
+
+def _score_numeric_numpy(
+    salary_min: np.ndarray,
+    salary_max: np.ndarray,
+    posted_us: np.ndarray,
+    deadline_us: np.ndarray,
+    rating: np.ndarray,
+    now_us: int,
+    weights: Tuple[float, float, float, float],
+) -> np.ndarray:
+    """Vectorized scores; see score_numeric"""
+    recency_decay, salary_w, deadline_w, rating_w = weights
+    scores = np.zeros((len(salary_min), 4))
+
+    # Recency (decays per whole day since posting)
+    has_posted = posted_us != NAT
+    days_old = (now_us - posted_us[has_posted]) // US_PER_DAY
+    scores[has_posted, RECENCY] = np.maximum(0.0, 1.0 - days_old * recency_decay)
+
+    # Salary (average of min and max when both are set)
+    min_filled = np.nan_to_num(salary_min)
+    max_filled = np.nan_to_num(salary_max)
+    has_salary = (min_filled != 0) | (max_filled != 0)
+    both = ~np.isnan(salary_min) & ~np.isnan(salary_max)
+    salary = np.where(
+        both,
+        (min_filled + max_filled) / 2,
+        np.where(min_filled != 0, min_filled, max_filled),
+    )
+    scores[has_salary, SALARY] = (
+        _SALARY_LUT[np.digitize(salary[has_salary], _SALARY_BINS, right=True)] * salary_w
+    )
+
+    # Deadline urgency (whole days until the deadline)
+    has_deadline = deadline_us != NAT
+    days_left = (deadline_us[has_deadline] - now_us) // US_PER_DAY
+    scores[has_deadline, DEADLINE] = (
+        _DEADLINE_LUT[np.digitize(days_left, _DEADLINE_BINS, right=True)] * deadline_w
+    )
+
+    # Company rating (normalized from a 5-star scale)
+    has_rating = ~np.isnan(rating)
+    scores[has_rating, COMPANY_RATING] = rating[has_rating] / 5.0 * rating_w
+
+    return scores
+
+def _score_numeric_loop(salary_min, salary_max, posted_us, deadline_us, rating, now_us, weights):
+    """Row-at-a-time scores with the same semantics, for compilation with numba"""
+    recency_decay, salary_w, deadline_w, rating_w = weights
+    n = salary_min.shape[0]
+    scores = np.zeros((n, 4))
+
+    for i in prange(n):
+        if posted_us[i] != NAT:
+            days_old = (now_us - posted_us[i]) // US_PER_DAY
+            scores[i, RECENCY] = max(0.0, 1.0 - days_old * recency_decay)
+
+        low = salary_min[i]
+        high = salary_max[i]
+        low_filled = 0.0 if np.isnan(low) else low
+        high_filled = 0.0 if np.isnan(high) else high
+        if low_filled != 0 or high_filled != 0:
+            if not np.isnan(low) and not np.isnan(high):
+                salary = (low_filled + high_filled) / 2
+            elif low_filled != 0:
+                salary = low_filled
+            else:
+                salary = high_filled
+            if salary > 100000:
+                band = 1.0
+            elif salary > 70000:
+                band = 0.8
+            elif salary > 50000:
+                band = 0.6
+            elif salary > 30000:
+                band = 0.4
+            else:
+                band = 0.2
+            scores[i, SALARY] = band * salary_w
+
+        if deadline_us[i] != NAT:
+            days_left = (deadline_us[i] - now_us) // US_PER_DAY
+            if days_left <= 1:
+                urgency = 1.0
+            elif days_left <= 3:
+                urgency = 0.8
+            elif days_left <= 7:
+                urgency = 0.5
+            elif days_left <= 14:
+                urgency = 0.3
+            elif days_left <= 30:
+                urgency = 0.1
+            else:
+                urgency = 0.0
+            scores[i, DEADLINE] = urgency * deadline_w
+
+        if not np.isnan(rating[i]):
+            scores[i, COMPANY_RATING] = rating[i] / 5.0 * rating_w
+
+    return scores
+
+if njit is not None:
+    _score_numeric_jit = njit(parallel=True, cache=True)(_score_numeric_loop)
+else:
+    _score_numeric_jit = None
+
+# Below this many rows the NumPy path wins over the compiled kernel's
+# thread start-up cost
+JIT_MIN_ROWS = 2048
+
+def score_numeric(
+    salary_min: np.ndarray,
+    salary_max: np.ndarray,
+    posted_us: np.ndarray,
+    deadline_us: np.ndarray,
+    rating: np.ndarray,
+    now_us: int,
+    weights: Tuple[float, float, float, float],
+) -> np.ndarray:
+    """
+    Score the numeric ranking factors for a batch.
+
+    Salaries and ratings are float64 with NaN for missing values; dates are
+    int64 microseconds since the epoch with NAT for missing values. weights is
+    (recency_decay, salary_weight, deadline_urgency, company_rating).
+    Returns an (N, 4) array indexed by RECENCY, SALARY, DEADLINE, COMPANY_RATING.
+    """
+    if _score_numeric_jit is not None and len(salary_min) >= JIT_MIN_ROWS:
+        return _score_numeric_jit(
+            salary_min, salary_max, posted_us, deadline_us, rating, now_us, weights
+        )
+    return _score_numeric_numpy(
+        salary_min, salary_max, posted_us, deadline_us, rating, now_us, weights
+    )
+
+def vectorize_batch(internships: Sequence) -> Dict[str, np.ndarray]:
+    """Materialize the numeric fields of a batch as NumPy arrays (missing values are NaN/NAT)"""
+    n = len(internships)
+    return {
+        "salary_min": np.fromiter(
+            (i.salary_min if i.salary_min is not None else np.nan for i in internships),
+            dtype=np.float64, count=n,
+        ),
+        "salary_max": np.fromiter(
+            (i.salary_max if i.salary_max is not None else np.nan for i in internships),
+            dtype=np.float64, count=n,
+        ),
+        # Microseconds since the epoch, NaT (missing) becomes NAT
+        "posted_date": np.array(
+            [i.posted_date for i in internships], dtype="datetime64[us]"
+        ).view(np.int64),
+        "deadline": np.array(
+            [i.application_deadline for i in internships], dtype="datetime64[us]"
+        ).view(np.int64),
+        "company_rating": np.fromiter(
+            (
+                rating if (rating := getattr(i, 'company_rating', None)) is not None else np.nan
+                for i in internships
+            ),
+            dtype=np.float64, count=n,
+        ),
+    }
+
+def score_internships(
+    internships: Sequence,
+    now: datetime,
+    weights: Tuple[float, float, float, float],
+) -> np.ndarray:
+    """Materialize a batch of internships and score its numeric factors; see score_numeric"""
+    batch = vectorize_batch(internships)
+    return score_numeric(
+        batch["salary_min"],
+        batch["salary_max"],
+        batch["posted_date"],
+        batch["deadline"],
+        batch["company_rating"],
+        int(np.datetime64(now, "us").view(np.int64)),
+        weights,
+    )
+
+def top_k_indices(scores: Sequence[float], limit: Optional[int] = None) -> List[int]:
+    """
+    Indices of the highest scores, highest first, truncated like list[:limit].
+
+    Equal scores keep their input order, as with a stable sort. When limit is
+    smaller than the batch, argpartition narrows the candidates in O(N) so
+    only they are sorted.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if limit is not None and 0 < limit < len(scores):
+        # Everything tied with the limit-th best score stays a candidate so
+        # ties are broken by position, not by where argpartition put them
+        kth_best = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+        candidates = np.flatnonzero(scores >= kth_best)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return order[:limit].tolist()
+    order = np.argsort(-scores, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    return order.tolist()
@@ -1,86 +1,240 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import math
 import re
-from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import Counter, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
 
-from pydantic import BaseModel
-import numpy as np
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-keyword substring checks
+    ahocorasick = None
 
-from app.models.internship import Internship, InternshipPublic
+from app.models.internship import InternshipPublic
 from app.models.user import User
 from .weights import RankingWeights, get_weights_for_user
 
-class RankingResult(BaseModel):
+@lru_cache(maxsize=4096)
+def _lower(value: str) -> str:
+    """Lower-case a string, caching results for values seen across rankings (e.g. skill names)"""
+    return value.lower()
+
+_SKILL_TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+# Title terms marking internship/co-op postings. Plain substrings on purpose:
+# "intern" must also match "internship".
+_INTERNSHIP_SIGNAL_RE = re.compile(r'intern|co[- ]?op|student|new grad|entry level', re.IGNORECASE)
+
+@lru_cache(maxsize=8192)
+def _lowered_fields(
+    internship_id, title: str, description: str, location: Optional[str]
+) -> Tuple[str, str, Optional[str]]:
+    """
+    Lower-cased (title + description, title, location) for an internship.
+    
+    Keyed by id and the raw strings, so postings ranked again (later pages,
+    refreshes) skip the work while edited postings get fresh values.
+    """
+    return (
+        f"{title} {description}".lower(),
+        title.lower() if title else title,
+        location.lower() if location else None,
+    )
+
+@lru_cache(maxsize=1024)
+def _extract_keywords_cached(user_key: tuple) -> Tuple[Tuple[str, float], ...]:
+    """
+    Build (keyword, weight) pairs from a user's profile.
+    
+    user_key is (sorted skills, (field, degree) per education entry,
+    (title, company) per experience entry); later entries win on duplicates.
+    """
+    skills, education, experience = user_key
+    keywords = {}
+    
+    # Add skills as keywords
+    for skill in skills:
+        keywords[skill] = 1.0
+    
+    # Add education field keywords
+    for field, degree in education:
+        if field is not None:
+            keywords[field.lower()] = 1.5
+        if degree is not None:
+            keywords[degree.lower()] = 1.2
+    
+    # Add work experience keywords
+    for title, company in experience:
+        if title is not None:
+            keywords[title.lower()] = 1.3
+        if company is not None:
+            keywords[company.lower()] = 0.8
+    
+    return tuple(keywords.items())
+
+@lru_cache(maxsize=4096)
+def _skill_tokens(skill: str) -> frozenset:
+    """Split a skill name into its lower-cased alphanumeric tokens"""
+    return frozenset(token for token in _SKILL_TOKEN_SPLIT_RE.split(skill.lower()) if token)
+
+@dataclass(slots=True)
+class RankingResult:
     """Result of ranking a single internship"""
     internship: InternshipPublic
     score: float
     score_breakdown: Dict[str, float]
     matched_keywords: List[str]
     matched_skills: List[str]
+    
+    def to_dict(self) -> Dict:
+        """Same shape as the former pydantic model_dump()"""
+        return {
+            'internship': self.internship.model_dump(),
+            'score': self.score,
+            'score_breakdown': dict(self.score_breakdown),
+            'matched_keywords': list(self.matched_keywords),
+            'matched_skills': list(self.matched_skills),
+        }
+
+# Plain tuple snapshot of RankingWeights for attribute access in the scoring loop
+_WeightsFast = namedtuple('_WeightsFast', list(RankingWeights.model_fields))
 
 class RankingEngine:
     """Engine for ranking internships based on various factors"""
     
     def __init__(self, user: Optional[User] = None, weights: Optional[RankingWeights] = None):
         self.user = user
-        self.weights = weights or get_weights_for_user(
-            user.user_type if user and hasattr(user, 'user_type') else None
-        )
-        self.user_skills = set(
+        self.user_skills = frozenset(
             skill.lower() 
             for skill in (user.skills if user and hasattr(user, 'skills') else [])
         )
+        self._user_skill_tokens = frozenset(
+            token for skill in self.user_skills for token in _skill_tokens(skill)
+        )
         self.user_location = user.location.lower() if user and user.location else None
+        # City and province/state parts of the user's "City, Province" location
+        self._user_city = self.user_location.split(',')[0].strip() if self.user_location else None
+        self._user_province = (
+            self.user_location.rsplit(',', 1)[-1].strip()
+            if self.user_location and ',' in self.user_location
+            else None
+        )
         self.user_keywords = self._extract_keywords_from_user()
+        self.weights = weights or get_weights_for_user(
+            user.user_type if user and hasattr(user, 'user_type') else None
+        )
+    
+    @property
+    def weights(self) -> RankingWeights:
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: RankingWeights) -> None:
+        # Callers may swap weights after construction, so derived values are rebuilt here
+        self._weights = weights
+        self._fast_weights = _WeightsFast._make(
+            getattr(weights, name) for name in _WeightsFast._fields
+        )
+        must_w = weights.must_have_keywords
+        nice_w = weights.nice_have_keywords * 0.5
+        self._keyword_weights = tuple(
+            (keyword, weight * must_w, weight * nice_w)
+            for keyword, weight in self.user_keywords.items()
+        )
+        self._keyword_automaton = self._build_keyword_automaton()
+        # Space-padded keywords for the substring fallback's exact-match test
+        self._padded_keywords = tuple(
+            (entry, f' {entry[0]} ') for entry in self._keyword_weights
+        )
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over the user's keywords (None if unavailable)"""
+        if ahocorasick is None or not self._keyword_weights:
+            return None
+        automaton = ahocorasick.Automaton()
+        for entry in self._keyword_weights:
+            automaton.add_word(entry[0], entry)
+        automaton.make_automaton()
+        return automaton
     
     def _extract_keywords_from_user(self) -> Dict[str, float]:
         """Extract keywords from user profile, resume, etc."""
-        keywords = defaultdict(float)
-        
         if not self.user:
-            return keywords
+            return {}
         
-        # Add skills as keywords
-        for skill in self.user_skills:
-            keywords[skill] = 1.0
+        # Only the profile values that feed the keywords go into the cache key,
+        # so engines built per request for the same user share one extraction
+        education = getattr(self.user, 'education', None) or []
+        experience = getattr(self.user, 'experience', None) or []
+        user_key = (
+            tuple(sorted(self.user_skills)),
+            tuple((edu.get('field'), edu.get('degree')) for edu in education),
+            tuple((exp.get('title'), exp.get('company')) for exp in experience),
+        )
+        return dict(_extract_keywords_cached(user_key))
+    
+    def _match_keywords(self, text_lower: str) -> Dict[Tuple[str, float, float], Tuple[bool, int]]:
+        """
+        Find the user's keywords in an already lower-cased text.
         
-        # Add education field keywords
-        if hasattr(self.user, 'education') and self.user.education:
-            for edu in self.user.education:
-                if 'field' in edu:
-                    keywords[edu['field'].lower()] = 1.5
-                if 'degree' in edu:
-                    keywords[edu['degree'].lower()] = 1.2
+        Returns a mapping of keyword entry -> (exact match seen, occurrence count).
+        A match is exact when it is space-delimited or at the edge of the text.
+        """
+        if not text_lower or not self._keyword_weights:
+            return {}
         
-        # Add work experience keywords
-        if hasattr(self.user, 'experience') and self.user.experience:
-            for exp in self.user.experience:
-                if 'title' in exp:
-                    keywords[exp['title'].lower()] = 1.3
-                if 'company' in exp:
-                    keywords[exp['company'].lower()] = 0.8
+        matches = {}
         
-        return keywords
-    
-    def _calculate_keyword_score(self, text: str) -> Tuple[float, List[str]]:
-        """Calculate keyword match score for a text"""
-        if not text or not self.user_keywords:
-            return 0.0, []
+        if self._keyword_automaton is not None:
+            last = len(text_lower) - 1
+            for end, entry in self._keyword_automaton.iter(text_lower):
+                start = end - len(entry[0]) + 1
+                exact = (
+                    (start == 0 or text_lower[start - 1] == ' ')
+                    and (end == last or text_lower[end + 1] == ' ')
+                )
+                seen_exact, count = matches.get(entry, (False, 0))
+                matches[entry] = (seen_exact or exact, count + 1)
+            return matches
         
-        text_lower = text.lower()
+        text_padded = f' {text_lower} '
+        for entry, keyword_padded in self._padded_keywords:
+            count = text_lower.count(entry[0])
+            if count:
+                matches[entry] = (text_padded.find(keyword_padded) >= 0, count)
+        return matches
+    
+    @staticmethod
+    def _keyword_idf(
+        keyword_matches: List[Dict[Tuple[str, float, float], Tuple[bool, int]]]
+    ) -> Dict[str, float]:
+        """Inverse document frequency of each matched keyword across the batch"""
+        document_frequency = Counter(entry[0] for matches in keyword_matches for entry in matches)
+        n = len(keyword_matches)
+        return {
+            keyword: 1.0 + math.log(n / (df + 1))
+            for keyword, df in document_frequency.items()
+        }
+    
+    def _calculate_keyword_score(
+        self,
+        matches: Dict[Tuple[str, float, float], Tuple[bool, int]],
+        idf: Dict[str, float],
+    ) -> Tuple[float, List[str]]:
+        """Calculate the TF-IDF weighted keyword score for one internship's matches"""
         score = 0.0
         matched_keywords = []
         
-        for keyword, weight in self.user_keywords.items():
-            # Exact match
-            if f' {keyword} ' in f' {text_lower} ':
-                score += weight * self.weights.must_have_keywords
+        for (keyword, must_score, nice_score), (exact, count) in matches.items():
+            # Sub-linear term frequency so keyword stuffing is not rewarded linearly
+            tf_idf = (1.0 + math.log(count)) * idf[keyword]
+            if exact:
+                score += must_score * tf_idf
                 matched_keywords.append(keyword)
-            # Fuzzy match (using simple substring matching, could be improved with TF-IDF)
-            elif keyword in text_lower:
-                score += weight * self.weights.nice_have_keywords * 0.5
+            else:
+                # Substring-only match
+                score += nice_score * tf_idf
                 matched_keywords.append(f"{keyword}*")
         
         return score, matched_keywords
@@ -90,134 +244,74 @@ class RankingEngine:
         if not self.user_skills or not internship.skills:
             return 0.0, []
         
+        # Loop invariants as locals
+        user_skills = self.user_skills
+        user_skill_tokens = self._user_skill_tokens
+        
         matched_skills = []
         score = 0.0
         
         for skill in internship.skills:
-            skill_lower = skill.lower()
+            skill_lower = _lower(skill)
             # Check for exact match
-            if skill_lower in self.user_skills:
-                score += self.weights.skills_match
+            if skill_lower in user_skills:
+                score += 1.0
                 matched_skills.append(skill)
-            # Check for partial match
-            else:
-                for user_skill in self.user_skills:
-                    if user_skill in skill_lower or skill_lower in user_skill:
-                        score += self.weights.skills_match * 0.5
-                        matched_skills.append(f"{skill}~")
-                        break
+            # Check for partial match (the skills share a word, e.g. "data analysis" / "data")
+            elif not user_skill_tokens.isdisjoint(_skill_tokens(skill_lower)):
+                score += 0.5
+                matched_skills.append(f"{skill}~")
         
-        # Normalize by number of skills in the internship
-        if internship.skills:
-            score = min(score / len(internship.skills), 1.0) * self.weights.skills_match
+        # Normalize by number of skills in the internship (1.0 per exact
+        # match, 0.5 per partial) and apply the weight once
+        score = min(score / len(internship.skills), 1.0) * self._fast_weights.skills_match
         
         return score, matched_skills
     
-    def _calculate_location_score(self, internship: InternshipPublic) -> float:
-        """Calculate location match score"""
-        if not self.user_location or not internship.location:
+    def _calculate_location_score(
+        self, internship: InternshipPublic, location_lower: Optional[str]
+    ) -> float:
+        """Calculate location match score from the lower-cased posting location"""
+        if not self.user_location or not location_lower:
             return 0.0
         
         # Check for remote work
         if internship.is_remote:
-            return self.weights.remote_work
+            return self._fast_weights.remote_work
+        
+        loc_w = self._fast_weights.location_match
         
         # Check for exact location match
-        if self.user_location.lower() in internship.location.lower():
-            return self.weights.location_match
+        if self.user_location in location_lower:
+            return loc_w
         
         # Check for same city (simple check, could be improved with geocoding)
-        user_city = self.user_location.split(',')[0].strip().lower()
-        if user_city and user_city in internship.location.lower():
-            return self.weights.location_match * 0.7
+        if self._user_city and self._user_city in location_lower:
+            return loc_w * 0.7
         
         # Check for same province/state
-        if ',' in self.user_location and ',' in internship.location:
-            user_province = self.user_location.split(',')[-1].strip().lower()
-            job_province = internship.location.split(',')[-1].strip().lower()
-            if user_province and user_province in job_province:
-                return self.weights.location_match * 0.3
+        if self._user_province and ',' in location_lower:
+            job_province = location_lower.rsplit(',', 1)[-1].strip()
+            if self._user_province in job_province:
+                return loc_w * 0.3
         
         return 0.0
     
-    def _calculate_recency_score(self, posted_date: datetime) -> float:
-        """Calculate recency score (higher for more recent postings)"""
-        if not posted_date:
-            return 0.0
-        
-        days_old = (datetime.utcnow() - posted_date).days
-        return max(0.0, 1.0 - (days_old * self.weights.recency_decay))
-    
     def _calculate_internship_signal(self, title: str) -> float:
         """Check if the posting is specifically for internships/co-ops"""
         if not title:
             return 0.0
         
-        internship_terms = ['intern', 'co-op', 'coop', 'co op', 'student', 'new grad', 'entry level']
-        title_lower = title.lower()
-        
-        if any(term in title_lower for term in internship_terms):
-            return self.weights.internship_signal
+        if _INTERNSHIP_SIGNAL_RE.search(title):
+            return self._fast_weights.internship_signal
         
         return 0.0
     
-    def _calculate_salary_score(self, internship: InternshipPublic) -> float:
-        """Calculate normalized salary score (0-1)"""
-        if not internship.salary_min and not internship.salary_max:
-            return 0.0
-        
-        # Use average if both min and max are available
-        if internship.salary_min is not None and internship.salary_max is not None:
-            salary = (internship.salary_min + internship.salary_max) / 2
-        else:
-            salary = internship.salary_min or internship.salary_max or 0
-        
-        # Normalize salary (this is a simplified example)
-        # In a real app, you'd want to normalize based on industry/role averages
-        if salary > 100000:  # $100k+
-            return 1.0 * self.weights.salary_weight
-        elif salary > 70000:  # $70k-$100k
-            return 0.8 * self.weights.salary_weight
-        elif salary > 50000:  # $50k-$70k
-            return 0.6 * self.weights.salary_weight
-        elif salary > 30000:  # $30k-$50k
-            return 0.4 * self.weights.salary_weight
-        else:  # <$30k
-            return 0.2 * self.weights.salary_weight
-    
-    def _calculate_deadline_urgency(self, deadline: Optional[datetime]) -> float:
-        """Calculate urgency score based on application deadline"""
-        if not deadline:
-            return 0.0
-        
-        days_until_deadline = (deadline - datetime.utcnow()).days
-        
-        if days_until_deadline <= 1:  # Less than 24 hours
-            return 1.0 * self.weights.deadline_urgency
-        elif days_until_deadline <= 3:  # 1-3 days
-            return 0.8 * self.weights.deadline_urgency
-        elif days_until_deadline <= 7:  # 3-7 days
-            return 0.5 * self.weights.deadline_urgency
-        elif days_until_deadline <= 14:  # 1-2 weeks
-            return 0.3 * self.weights.deadline_urgency
-        elif days_until_deadline <= 30:  # 2-4 weeks
-            return 0.1 * self.weights.deadline_urgency
-        else:  # More than a month
-            return 0.0
-    
-    def _calculate_company_rating_score(self, company_rating: Optional[float]) -> float:
-        """Calculate score based on company rating (if available)"""
-        if company_rating is None:
-            return 0.0
-        
-        # Normalize to 0-1 range (assuming 5-star rating)
-        normalized_rating = company_rating / 5.0
-        return normalized_rating * self.weights.company_rating
-    
     def rank_internships(
         self, 
         internships: List[InternshipPublic],
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
     ) -> List[RankingResult]:
         """
         Rank a list of internships based on relevance to the user
@@ -225,18 +319,52 @@ class RankingEngine:
         Args:
             internships: List of internships to rank
             limit: Maximum number of results to return (None for all)
+            now: Reference time for recency and deadline scores (defaults to
+                the current UTC time, read once per call)
             
         Returns:
             List of RankingResult objects, sorted by score (highest first)
         """
-        ranked = []
+        if not internships:
+            return []
+        
+        # NumPy (and numba, if installed) load on the first ranking rather
+        # than whenever the API imports this module
+        from . import _kernels
+        
+        # Pure-numeric factors are scored for the whole batch at once
+        if now is None:
+            now = datetime.utcnow()
+        w = self._fast_weights
+        numeric_scores = _kernels.score_internships(
+            internships,
+            now,
+            (w.recency_decay, w.salary_weight, w.deadline_urgency, w.company_rating),
+        ).tolist()
+        
+        lowered = [
+            _lowered_fields(
+                internship.id, internship.title, internship.description, internship.location
+            )
+            for internship in internships
+        ]
+        
+        # Keyword matches are found once per internship and reused for the
+        # batch-level document frequencies and the per-internship scores
+        keyword_matches = [self._match_keywords(text_lower) for text_lower, _, _ in lowered]
+        idf = self._keyword_idf(keyword_matches)
         
-        for internship in internships:
+        scores = []
+        breakdowns = []
+        matches = []
+        
+        for index, internship in enumerate(internships):
+            _, title_lower, location_lower = lowered[index]
             score_breakdown = {}
             
             # Calculate keyword match score
             keyword_score, matched_keywords = self._calculate_keyword_score(
-                f"{internship.title} {internship.description}"
+                keyword_matches[index], idf
             )
             score_breakdown["keywords"] = keyword_score
             
@@ -245,49 +373,37 @@ class RankingEngine:
             score_breakdown["skills"] = skills_score
             
             # Calculate location score
-            location_score = self._calculate_location_score(internship)
+            location_score = self._calculate_location_score(internship, location_lower)
             score_breakdown["location"] = location_score
             
-            # Calculate recency score
-            recency_score = self._calculate_recency_score(internship.posted_date)
-            score_breakdown["recency"] = recency_score
+            recency, salary, deadline, company_rating = numeric_scores[index]
+            score_breakdown["recency"] = recency
             
             # Check for internship/co-op in title
-            internship_score = self._calculate_internship_signal(internship.title)
+            internship_score = self._calculate_internship_signal(title_lower)
             score_breakdown["internship_signal"] = internship_score
             
-            # Calculate salary score
-            salary_score = self._calculate_salary_score(internship)
-            score_breakdown["salary"] = salary_score
-            
-            # Calculate deadline urgency
-            deadline_score = self._calculate_deadline_urgency(internship.application_deadline)
-            score_breakdown["deadline"] = deadline_score
+            score_breakdown["salary"] = salary
+            score_breakdown["deadline"] = deadline
             
-            # Calculate company rating score
-            company_rating = getattr(internship, 'company_rating', None)
-            company_score = self._calculate_company_rating_score(company_rating)
-            score_breakdown["company_rating"] = company_score
+            score_breakdown["company_rating"] = company_rating
             
             # Calculate total score
-            total_score = sum(score_breakdown.values())
-            
-            # Create result
-            result = RankingResult(
-                internship=internship,
-                score=total_score,
-                score_breakdown=score_breakdown,
+            scores.append(sum(score_breakdown.values()))
+            breakdowns.append(score_breakdown)
+            matches.append((matched_keywords, matched_skills))
+        
+        # Select (and sort) the top results first, so results are only
+        # created for internships that are returned
+        ranked = []
+        for index in _kernels.top_k_indices(scores, limit):
+            matched_keywords, matched_skills = matches[index]
+            ranked.append(RankingResult(
+                internship=internships[index],
+                score=scores[index],
+                score_breakdown=breakdowns[index],
                 matched_keywords=matched_keywords,
                 matched_skills=matched_skills,
-            )
-            
-            ranked.append(result)
-        
-        # Sort by score (descending)
-        ranked.sort(key=lambda x: x.score, reverse=True)
-        
-        # Apply limit if specified
-        if limit is not None:
-            ranked = ranked[:limit]
+            ))
         
         return ranked
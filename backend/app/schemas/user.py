@@ -38,7 +38,7 @@ class UserUpdate(UserBase):
 # Properties shared by models stored in DB
 class UserInDBBase(UserBase):
     id: int
-    email: EmailStr
+    email: str  # validated by UserCreate/UserUpdate before it was stored
     is_active: bool
     created_at: datetime
     updated_at: datetime
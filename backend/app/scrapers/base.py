@@ -1,13 +1,91 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import ClassVar, List, Optional, Dict, Any
+from urllib.parse import urlparse
 import asyncio
 import logging
+import re
+import string
+import time
 
+import msgspec
+from dateutil import parser as date_parser
 from pydantic import BaseModel, Field
 
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PRINTABLE = frozenset(string.printable)
+
+# Date formats seen on job boards, tried before the (slow) fuzzy parser
+_DATE_FORMATS = ("%Y-%m-%d", "%B %d, %Y", "%d %b %Y")
+
+def utc_timestamp(value: datetime) -> float:
+    """Epoch seconds for a datetime, reading naive values as UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> datetime:
+    """Parse a date string, trying the known formats before dateutil's fuzzy parser"""
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return date_parser.parse(date_str, fuzzy=True)
+
+class _PrintableTable(dict):
+    """str.translate table dropping non-printable characters, filled in per code point on first use"""
+    def __missing__(self, code_point: int) -> Optional[int]:
+        value = code_point if chr(code_point) in _PRINTABLE else None
+        self[code_point] = value
+        return value
+
+_PRINTABLE_TABLE = _PrintableTable()
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter: bursts of up to `capacity` requests, `refill_per_sec` on average"""
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.last: Optional[float] = None
+        # Buckets are shared at class level and can outlive an event loop, but an
+        # asyncio.Lock is bound to one loop, so the lock is made per running loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _loop_lock(self) -> asyncio.Lock:
+        """Lock for the running event loop, replacing one left over from another loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        return self._lock
+    
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self._loop_lock():
+            while True:
+                # The bucket only needs a monotonic clock, not the event loop's
+                now = time.monotonic()
+                if self.last is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_per_sec)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_sec)
+
 class ScrapeQuery(BaseModel):
     """Query parameters for scraping jobs"""
     keywords: List[str] = Field(default_factory=list)
@@ -18,8 +96,8 @@ class ScrapeQuery(BaseModel):
     skip_duplicates: bool = True
     full_descriptions: bool = True
 
-class RawPosting(BaseModel):
-    """Raw job posting data from a scraper"""
+class RawPosting(msgspec.Struct, kw_only=True):
+    """Raw job posting data from a scraper (built by our own parsers, so not validated)"""
     # Required fields
     title: str
     company: str
@@ -40,19 +118,30 @@ class RawPosting(BaseModel):
     is_remote: bool = False
     job_type: Optional[str] = None  # full-time, part-time, contract, etc.
     industry: Optional[str] = None
-    skills: List[str] = Field(default_factory=list)
-    requirements: List[str] = Field(default_factory=list)
-    benefits: List[str] = Field(default_factory=list)
+    skills: List[str] = msgspec.field(default_factory=list)
+    requirements: List[str] = msgspec.field(default_factory=list)
+    benefits: List[str] = msgspec.field(default_factory=list)
+    
+    # Internal use: not part of the serialized posting, see to_dict()
+    raw_data: Dict[str, Any] = msgspec.field(default_factory=dict)
+    posted_ts: float = 0.0  # posted_date as epoch seconds, set on construction
     
-    # Internal use
-    raw_data: Dict[str, Any] = Field(default_factory=dict, exclude=True)
+    def __post_init__(self):
+        self.posted_ts = utc_timestamp(self.posted_date)
     
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self) -> Dict[str, Any]:
+        """Posting fields as a dict, without raw_data or posted_ts"""
+        data = msgspec.structs.asdict(self)
+        del data['raw_data']
+        del data['posted_ts']
+        return data
 
 class BaseScraper(ABC):
     """Base class for all scrapers"""
     
+    # One bucket per host, so every scraper instance hitting a site shares its budget
+    _buckets: ClassVar[Dict[str, AsyncTokenBucket]] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.name = self.__class__.__name__.replace("Scraper", "").lower()
@@ -60,15 +149,24 @@ class BaseScraper(ABC):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        self.rate_limit = 2.0  # seconds between requests
-        self.last_request = 0
+        self.rate_limit = 2.0  # average seconds between requests
+        self.burst = self.config.get("burst", 1)  # requests allowed back-to-back
+        self._keyword_automata: Dict[frozenset, Any] = {}
         
+    @property
+    def bucket(self) -> AsyncTokenBucket:
+        """Rate limiter shared by all scrapers for this scraper's host"""
+        host = urlparse(self.base_url).netloc or self.name
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = AsyncTokenBucket(self.burst, 1.0 / self.rate_limit)
+            self._buckets[host] = bucket
+        return bucket
+    
     async def _rate_limit(self):
         """Enforce rate limiting between requests"""
-        elapsed = asyncio.get_event_loop().time() - self.last_request
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
-        self.last_request = asyncio.get_event_loop().time()
+        if self.rate_limit > 0:
+            await self.bucket.acquire()
     
     @abstractmethod
     async def scrape(self, query: ScrapeQuery) -> List[RawPosting]:
@@ -83,36 +181,72 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def collect(self, query: ScrapeQuery, postings: List[RawPosting]) -> None:
+        """
+        Scrape into `postings` as results come in, so a caller that stops
+        waiting still keeps what was found (scrapers that can, override this)
+        """
+        postings.extend(await self.scrape(query))
+    
+    def run_budget(self, query: ScrapeQuery) -> float:
+        """Seconds a run of the query may take: one rate-limited request per result, plus the search"""
+        return self.rate_limit * (query.max_results + 1)
+    
+    async def aclose(self) -> None:
+        """Release resources held across scrape() calls (HTTP clients, browsers)"""
+        pass
+    
     async def process_results(self, postings: List[RawPosting], query: ScrapeQuery) -> List[RawPosting]:
         """
         Process and filter raw postings
         """
         # Filter out old postings
+        cutoff = None
         if query.days_old > 0:
-            min_date = datetime.utcnow() - timedelta(days=query.days_old)
-            postings = [p for p in postings if p.posted_date >= min_date]
+            cutoff = utc_timestamp(datetime.utcnow() - timedelta(days=query.days_old))
         
-        # Filter by keywords if provided
-        if query.keywords:
-            keyword_set = set(k.lower() for k in query.keywords)
-            filtered = []
-            for posting in postings:
-                content = f"{posting.title} {posting.description}".lower()
-                if any(keyword in content for keyword in keyword_set):
-                    filtered.append(posting)
-            postings = filtered
+        # Filter by keywords if provided (an empty keyword matches everything)
+        keyword_set = frozenset(k.lower() for k in query.keywords)
+        if '' in keyword_set:
+            keyword_set = frozenset()
+        automaton = self._keyword_automaton(keyword_set) if keyword_set else None
         
-        # Limit results
-        if query.max_results > 0:
-            postings = postings[:query.max_results]
+        # Single pass that stops as soon as max_results postings have matched
+        filtered = []
+        for posting in postings:
+            if cutoff is not None and posting.posted_ts < cutoff:
+                continue
+            
+            if keyword_set:
+                content = f"{posting.title} {posting.description}".lower()
+                if automaton is not None:
+                    if next(automaton.iter(content), None) is None:
+                        continue
+                elif not any(keyword in content for keyword in keyword_set):
+                    continue
+            
+            filtered.append(posting)
+            if len(filtered) == query.max_results:
+                break
             
-        return postings
+        return filtered
+    
+    def _keyword_automaton(self, keywords: frozenset):
+        """Aho-Corasick automaton over the keywords, cached per keyword set (None without pyahocorasick)"""
+        if ahocorasick is None:
+            return None
+        automaton = self._keyword_automata.get(keywords)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._keyword_automata[keywords] = automaton
+        return automaton
     
     def extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text"""
-        import re
-        email_regex = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        return re.findall(email_regex, text)
+        return _EMAIL_RE.findall(text)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -123,16 +257,13 @@ class BaseScraper(ABC):
         text = ' '.join(text.split())
         
         # Remove non-printable characters
-        import string
-        printable = set(string.printable)
-        text = ''.join(filter(lambda x: x in printable, text))
+        text = text.translate(_PRINTABLE_TABLE)
         
         return text.strip()
     
     def parse_date(self, date_str: str) -> datetime:
         """Parse date string into datetime object"""
-        from dateutil import parser
         try:
-            return parser.parse(date_str, fuzzy=True)
+            return _parse_date_cached(date_str)
         except (ValueError, OverflowError):
             return datetime.utcnow()
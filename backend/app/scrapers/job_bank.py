@@ -1,16 +1,40 @@
 import asyncio
 import logging
+import math
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from .base import BaseScraper, RawPosting, ScrapeQuery
-from ..core.config import settings
+from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_SALARY_RE = re.compile(
+    r'\$(?P<min>[\d,.]+)(?:\s*to\s*\$?(?P<max>[\d,.]+))?\s*(?P<period>per hour|per year|annually|/year)',
+    re.IGNORECASE,
+)
+_SALARY_PERIODS = {
+    'per hour': "CAD/hour",
+    'per year': "CAD/year",
+    'annually': "CAD/year",
+    '/year': "CAD/year",
+}
+_REMOTE_RE = re.compile(r'remote|work from home|telecommute', re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# CSS selectors for search result pages
+_RESULT_SEL = 'article.result'
+_TITLE_SEL = 'span.noctitle'
+_LINK_SEL = 'a'
+_BUSINESS_SEL = 'li.business'
+_LOCATION_SEL = 'li.location'
+_DATE_SEL = 'span.date'
+_FOUND_SEL = 'span.found'
+
 @scraper_registry.register
 class JobBankScraper(BaseScraper):
     """Scraper for Job Bank Canada (https://www.jobbank.gc.ca/)"""
@@ -21,15 +45,38 @@ class JobBankScraper(BaseScraper):
         self.base_url = "https://www.jobbank.gc.ca"
         self.search_url = f"{self.base_url}/jobbank/jobsearch"
         self.headers = {
-            "User-Agent": settings.USER_AGENT,
+            "User-Agent": get_settings().SCRAPER_USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-CA,en-US;q=0.7,en;q=0.3",
             "Referer": f"{self.base_url}/",
         }
         self.rate_limit = 1.5  # Be respectful of their servers
+        self.detail_concurrency = 8  # Detail pages fetched at once (still paced by the rate limit)
+        self.results_per_page = 25
+        self.max_pages = 10  # Upper bound on search pages fetched for one query
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client kept across scrape() calls so connections and TLS sessions are reused"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=get_settings().SCRAPER_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            )
+        return self._client
     
-    async def _fetch_search_page(self, client: httpx.AsyncClient, query: ScrapeQuery, page: int = 1) -> Optional[str]:
-        """Fetch a search results page"""
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _fetch_search_page(self, client: httpx.AsyncClient, query: ScrapeQuery, page: int = 1) -> Optional[bytes]:
+        """Fetch a search results page (raw bytes; the parser detects the encoding)"""
         params = {
             "searchstring": " ".join(query.keywords) if query.keywords else "internship",
             "locationstring": query.location or "",
@@ -45,51 +92,76 @@ class JobBankScraper(BaseScraper):
                 self.search_url,
                 params=params,
                 headers=self.headers,
-                timeout=30.0,
+                timeout=get_settings().SCRAPER_TIMEOUT,
                 follow_redirects=True
             )
             response.raise_for_status()
-            return response.text
+            return response.content
         except (httpx.HTTPError, asyncio.TimeoutError) as e:
-            logger.error(f"Error fetching JobBank search page: {str(e)}")
+            logger.error("Error fetching JobBank search page: %s", e)
             return None
     
-    async def _parse_search_results(self, html: str) -> List[Dict[str, str]]:
-        """Parse job listing URLs from search results"""
+    async def _parse_search_results(self, html: bytes) -> Tuple[List[Dict[str, str]], Optional[int]]:
+        """Parse job listing URLs and the total result count (if shown) from search results"""
         if not html:
-            return []
+            return [], None
+        
+        try:
+            tree = LexborHTMLParser(html)
+        except Exception as e:
+            logger.error("Error parsing JobBank search page: %s", e)
+            return [], None
+        
+        found = tree.css_first(_FOUND_SEL)
+        total_digits = _NON_DIGIT_RE.sub('', found.text()) if found else ''
+        total_results = int(total_digits) if total_digits else None
         
-        soup = BeautifulSoup(html, 'lxml')
         jobs = []
         
-        for article in soup.select('article.result'):
+        for article in tree.css(_RESULT_SEL):
             try:
-                title_elem = article.select_one('span.noctitle')
-                if not title_elem or not title_elem.find('a'):
+                title_elem = article.css_first(_TITLE_SEL)
+                link = title_elem.css_first(_LINK_SEL) if title_elem else None
+                if not link:
                     continue
-                    
+                
+                business = article.css_first(_BUSINESS_SEL)
+                location = article.css_first(_LOCATION_SEL)
+                date = article.css_first(_DATE_SEL)
                 job = {
-                    'title': self.clean_text(title_elem.get_text(strip=True)),
-                    'url': self.base_url + title_elem.find('a')['href'],
-                    'company': self.clean_text(article.select_one('li.business').get_text(strip=True)) if article.select_one('li.business') else "",
-                    'location': self.clean_text(article.select_one('li.location').get_text(strip=True)) if article.select_one('li.location') else "",
-                    'date': article.select_one('span.date').get_text(strip=True) if article.select_one('span.date') else "",
+                    'title': self.clean_text(title_elem.text(strip=True)),
+                    'url': self.base_url + link.attributes['href'],
+                    'company': self.clean_text(business.text(strip=True)) if business else "",
+                    'location': self.clean_text(location.text(strip=True)) if location else "",
+                    'date': date.text(strip=True) if date else "",
                 }
                 jobs.append(job)
             except Exception as e:
-                logger.warning(f"Error parsing job listing: {str(e)}")
+                logger.warning("Error parsing job listing: %s", e)
                 continue
                 
-        return jobs
+        return jobs, total_results
+    
+    def _pages_needed(self, query: ScrapeQuery, first_page_count: int, total_results: Optional[int]) -> int:
+        """Number of search pages to fetch to cover max_results"""
+        if total_results is None:
+            # No count on the page: only a full first page suggests there are more
+            if first_page_count < self.results_per_page:
+                return 1
+            wanted = query.max_results or self.results_per_page
+        else:
+            wanted = min(query.max_results, total_results) if query.max_results else total_results
+        return max(1, min(self.max_pages, math.ceil(wanted / self.results_per_page)))
     
     async def _fetch_job_details(self, client: httpx.AsyncClient, job_url: str) -> Optional[Dict]:
         """Fetch and parse detailed job posting"""
         try:
             await self._rate_limit()
-            response = await client.get(job_url, headers=self.headers, timeout=30.0)
+            response = await client.get(job_url, headers=self.headers, timeout=get_settings().SCRAPER_TIMEOUT)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
+            # The parser needs the whole document; only the parsed tree outlives this call
+            tree = LexborHTMLParser(response.content)
+            del response
             
             # Extract job details
             job_details = {
@@ -102,45 +174,46 @@ class JobBankScraper(BaseScraper):
             }
             
             # Main job description
-            description_section = soup.select_one('div.job-posting-details')
+            description_section = tree.css_first('div.job-posting-details')
             if description_section:
-                job_details['description'] = self.clean_text(description_section.get_text())
+                job_details['description'] = self.clean_text(description_section.text())
             
             # Salary information
-            salary_section = soup.select_one('div.salary')
+            salary_section = tree.css_first('div.salary')
             if salary_section:
-                job_details['salary'] = self.clean_text(salary_section.get_text())
+                job_details['salary'] = self.clean_text(salary_section.text())
             
             # Employment type and other metadata
-            for item in soup.select('div.job-posting-brief'):
-                label = item.select_one('span.attribute-label')
-                if label and 'employment type' in label.text.lower():
-                    job_details['employment_type'] = self.clean_text(item.get_text())
-                elif label and 'start date' in label.text.lower():
-                    job_details['start_date'] = self.clean_text(item.get_text())
+            for item in tree.css('div.job-posting-brief'):
+                label = item.css_first('span.attribute-label')
+                label_text = label.text().lower() if label else ""
+                if 'employment type' in label_text:
+                    job_details['employment_type'] = self.clean_text(item.text())
+                elif 'start date' in label_text:
+                    job_details['start_date'] = self.clean_text(item.text())
             
             # Skills and requirements
-            for section in soup.select('div.profile-content'):
-                heading = section.select_one('h4')
+            for section in tree.css('div.profile-content'):
+                heading = section.css_first('h4')
                 if not heading:
                     continue
                     
-                heading_text = heading.get_text(strip=True).lower()
+                heading_text = heading.text(strip=True).lower()
                 if 'skills' in heading_text:
                     job_details['skills'] = [
-                        self.clean_text(li.get_text())
-                        for li in section.select('li')
+                        self.clean_text(li.text())
+                        for li in section.css('li')
                     ]
                 elif 'requirements' in heading_text:
                     job_details['requirements'] = [
-                        self.clean_text(li.get_text())
-                        for li in section.select('li')
+                        self.clean_text(li.text())
+                        for li in section.css('li')
                     ]
             
             return job_details
             
         except (httpx.HTTPError, asyncio.TimeoutError) as e:
-            logger.error(f"Error fetching job details from {job_url}: {str(e)}")
+            logger.error("Error fetching job details from %s: %s", job_url, e)
             return None
     
     def _parse_salary(self, salary_text: str) -> tuple[Optional[float], Optional[float], str]:
@@ -149,89 +222,105 @@ class JobBankScraper(BaseScraper):
             return None, None, "CAD"
         
         # Simple salary parsing - this can be enhanced based on actual formats
-        import re
-        
-        # Look for hourly rates
-        hourly_match = re.search(r'\$([\d,.]+)(?:\s*to\s*\$?([\d,.]+))?\s*per hour', salary_text, re.IGNORECASE)
-        if hourly_match:
-            min_sal = float(hourly_match.group(1).replace(',', ''))
-            max_sal = float(hourly_match.group(2).replace(',', '')) if hourly_match.group(2) else min_sal
-            return min_sal, max_sal, "CAD/hour"
-        
-        # Look for annual salaries
-        annual_match = re.search(r'\$([\d,.]+)(?:\s*to\s*\$?([\d,.]+))?\s*(?:per year|annually|/year)', salary_text, re.IGNORECASE)
-        if annual_match:
-            min_sal = float(annual_match.group(1).replace(',', ''))
-            max_sal = float(annual_match.group(2).replace(',', '')) if annual_match.group(2) else min_sal
-            return min_sal, max_sal, "CAD/year"
-        
-        return None, None, "CAD"
+        # (one pass classifies hourly vs annual and extracts the range)
+        match = _SALARY_RE.search(salary_text)
+        if not match:
+            return None, None, "CAD"
+        
+        min_sal = float(match.group('min').replace(',', ''))
+        max_sal = float(match.group('max').replace(',', '')) if match.group('max') else min_sal
+        return min_sal, max_sal, _SALARY_PERIODS[match.group('period').lower()]
+    
+    def run_budget(self, query: ScrapeQuery) -> float:
+        """Seconds a run of the query may take: every search and detail page waits on the rate limit"""
+        pages = min(self.max_pages, math.ceil(max(query.max_results, 1) / self.results_per_page))
+        return self.rate_limit * (pages + query.max_results)
+    
+    def _to_posting(self, job: Dict[str, str], details: Dict) -> RawPosting:
+        """Build a RawPosting from a search listing and its detail page"""
+        # Parse salary
+        salary_min, salary_max, salary_period = self._parse_salary(details.get('salary', ''))
+        
+        return RawPosting(
+            title=job['title'],
+            company=job['company'],
+            location=job['location'],
+            description=details.get('description', ''),
+            source=self.name,
+            source_id=job['url'].split('/')[-1],  # Use job ID from URL
+            posted_date=self.parse_date(job['date']),
+            url=job['url'],
+            salary_min=salary_min,
+            salary_max=salary_max,
+            salary_currency="CAD",
+            salary_period=salary_period,
+            is_remote=bool(_REMOTE_RE.search(job['location'])),
+            job_type=details.get('employment_type', ''),
+            skills=details.get('skills', []),
+            requirements=details.get('requirements', []),
+            raw_data={
+                'job': job,
+                'details': details
+            }
+        )
     
     async def scrape(self, query: ScrapeQuery) -> List[RawPosting]:
         """Scrape job postings from Job Bank Canada"""
+        all_postings: List[RawPosting] = []
+        await self.collect(query, all_postings)
+        return all_postings
+    
+    async def collect(self, query: ScrapeQuery, postings: List[RawPosting]) -> None:
+        """Scrape job postings from Job Bank Canada, adding each one as its details arrive"""
         if not query.keywords and not query.location:
             logger.warning("No keywords or location provided for JobBank search")
-            return []
-        
-        all_postings = []
-        
-        async with httpx.AsyncClient(
-            headers=self.headers,
-            timeout=30.0,
-            follow_redirects=True,
-            http2=True
-        ) as client:
-            # Get first page of results
-            html = await self._fetch_search_page(client, query, page=1)
-            if not html:
-                return []
-            
-            # Parse job listings from first page
-            jobs = await self._parse_search_results(html)
+            return
+        
+        client = self.client
+        
+        # Get first page of results
+        html = await self._fetch_search_page(client, query, page=1)
+        if not html:
+            return
+        
+        # Parse job listings from first page
+        jobs, total_results = await self._parse_search_results(html)
+        
+        # Fetch any further pages needed for max_results at once
+        pages_needed = self._pages_needed(query, len(jobs), total_results)
+        if pages_needed > 1:
+            pages = await asyncio.gather(*(
+                self._fetch_search_page(client, query, page=page)
+                for page in range(2, pages_needed + 1)
+            ))
+            for page_html in pages:
+                page_jobs, _ = await self._parse_search_results(page_html)
+                jobs.extend(page_jobs)
             
-            # Process each job listing
-            for job in jobs:
+            # Listings can shift between pages while they are fetched
+            if query.skip_duplicates:
+                jobs = list({job['url']: job for job in jobs}.values())
+        
+        # Respect max_results
+        if query.max_results:
+            jobs = jobs[:query.max_results]
+        
+        # Fetch job details concurrently, bounded by a semaphore
+        semaphore = asyncio.Semaphore(self.detail_concurrency)
+        
+        async def fetch(job: Dict[str, str]) -> None:
+            async with semaphore:
                 try:
-                    # Get job details
                     details = await self._fetch_job_details(client, job['url'])
-                    if not details:
-                        continue
-                    
-                    # Parse salary
-                    salary_min, salary_max, salary_period = self._parse_salary(details.get('salary', ''))
-                    
-                    # Create RawPosting
-                    posting = RawPosting(
-                        title=job['title'],
-                        company=job['company'],
-                        location=job['location'],
-                        description=details.get('description', ''),
-                        source=self.name,
-                        source_id=job['url'].split('/')[-1],  # Use job ID from URL
-                        posted_date=self.parse_date(job['date']),
-                        url=job['url'],
-                        salary_min=salary_min,
-                        salary_max=salary_max,
-                        salary_currency="CAD",
-                        salary_period=salary_period,
-                        is_remote=any(term in job['location'].lower() for term in ['remote', 'work from home', 'telecommute']),
-                        job_type=details.get('employment_type', ''),
-                        skills=details.get('skills', []),
-                        requirements=details.get('requirements', []),
-                        raw_data={
-                            'job': job,
-                            'details': details
-                        }
-                    )
-                    
-                    all_postings.append(posting)
-                    
-                    # Respect max_results
-                    if query.max_results and len(all_postings) >= query.max_results:
-                        break
-                        
                 except Exception as e:
-                    logger.error(f"Error processing job listing: {str(e)}")
-                    continue
+                    logger.error("Error fetching job details for %s: %s", job['url'], e)
+                    return
+            if not details:
+                return
+            
+            try:
+                postings.append(self._to_posting(job, details))
+            except Exception as e:
+                logger.error("Error processing job listing: %s", e)
         
-        return all_postings
+        await asyncio.gather(*(fetch(job) for job in jobs))
@@ -1,5 +1,7 @@
 from typing import Dict, Type, List, Optional
 from .base import BaseScraper, ScrapeQuery, RawPosting
+from ..core.config import get_settings
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +11,9 @@ class ScraperRegistry:
     
     def __init__(self):
         self._scrapers: Dict[str, Type[BaseScraper]] = {}
+        # One long-lived instance per scraper, so per-instance caches
+        # (HTTP clients, keyword automata) survive across runs
+        self._instances: Dict[str, BaseScraper] = {}
     
     def register(self, scraper_class: Type[BaseScraper]) -> None:
         """Register a new scraper class"""
@@ -17,12 +22,21 @@ class ScraperRegistry:
         
         name = scraper_class.__name__.lower().replace('scraper', '')
         self._scrapers[name] = scraper_class
-        logger.info(f"Registered scraper: {name}")
+        self._instances.pop(name, None)
+        logger.info("Registered scraper: %s", name)
     
     def get_scraper(self, name: str) -> Optional[Type[BaseScraper]]:
         """Get a scraper class by name"""
         return self._scrapers.get(name.lower())
     
+    def get_instance(self, name: str) -> Optional[BaseScraper]:
+        """Get the shared instance of a scraper by name, creating it on first use"""
+        name = name.lower()
+        scraper = self._instances.get(name)
+        if scraper is None and name in self._scrapers:
+            scraper = self._instances[name] = self._scrapers[name]()
+        return scraper
+    
     def get_available_scrapers(self) -> List[str]:
         """Get a list of all registered scraper names"""
         return list(self._scrapers.keys())
@@ -40,9 +54,11 @@ class ScraperRegistry:
             scraper_names: Optional list of scraper names to use. If None, uses all scrapers.
             
         Returns:
-            Dictionary mapping scraper names to lists of job postings
+            Dictionary mapping scraper names to lists of job postings.
+            A scraper that fails maps to an empty list; one that runs past its
+            run budget maps to the postings it had collected by then.
         """
-        import asyncio
+        settings = get_settings()
         
         if scraper_names is None:
             scraper_names = self.get_available_scrapers()
@@ -54,26 +70,57 @@ class ScraperRegistry:
             if name in self._scrapers
         ]
         
-        # Run scrapers in parallel
-        tasks = []
-        for name, scraper_class in scrapers_to_run:
-            logger.info(f"Starting scraper: {name}")
-            scraper = scraper_class()
-            tasks.append(scraper.scrape(query))
+        # Run scrapers in parallel, a bounded number at a time, each with its own
+        # time budget so one hung site can't hold up the rest
+        semaphore = asyncio.Semaphore(settings.SCRAPER_MAX_CONCURRENCY)
+        
+        async def run(name: str) -> List[RawPosting]:
+            async with semaphore:
+                logger.info("Starting scraper: %s", name)
+                scraper = self.get_instance(name)
+                # The budget follows the scraper's rate limit, with one request
+                # timeout of slack; SCRAPER_RUN_BUDGET caps it when set
+                budget = scraper.run_budget(query) + settings.SCRAPER_TIMEOUT
+                if settings.SCRAPER_RUN_BUDGET:
+                    budget = min(budget, settings.SCRAPER_RUN_BUDGET)
+                postings: List[RawPosting] = []
+                try:
+                    await asyncio.wait_for(scraper.collect(query, postings), timeout=budget)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Scraper %s ran past its %.0fs budget; keeping %d postings",
+                        name, budget, len(postings)
+                    )
+                return postings
         
         # Gather results
         results = {}
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
+        completed = await asyncio.gather(
+            *(run(name) for name, _ in scrapers_to_run),
+            return_exceptions=True
+        )
         
         # Process results
         for (name, _), result in zip(scrapers_to_run, completed):
             if isinstance(result, Exception):
-                logger.error(f"Scraper {name} failed: {str(result)}")
+                logger.error("Scraper %s failed: %s", name, result)
                 results[name] = []
             else:
                 results[name] = result
         
         return results
+    
+    async def close_all(self) -> None:
+        """Close every scraper instance (call at application shutdown)"""
+        instances = list(self._instances.items())
+        self._instances.clear()
+        completed = await asyncio.gather(
+            *(scraper.aclose() for _, scraper in instances),
+            return_exceptions=True
+        )
+        for (name, _), result in zip(instances, completed):
+            if isinstance(result, Exception):
+                logger.error("Error closing scraper %s: %s", name, result)
 
 # Create a global registry instance
 scraper_registry = ScraperRegistry()
@@ -46,6 +46,46 @@ def create_random_bookmark(
     )
 
 
+def create_random_bookmarks(
+    db: Session,
+    user_id: int,
+    n: int,
+    folder_id: Optional[UUID] = None,
+    **kwargs
+) -> List[models.Bookmark]:
+    """Create n random bookmarks for testing, inserted with a single flush"""
+    # Each bookmark gets its own random internship unless one is given
+    if "internship_id" in kwargs:
+        internship_ids = [kwargs.pop("internship_id")] * n
+    else:
+        from .internship import create_random_internship
+        internship_ids = [create_random_internship(db).id for _ in range(n)]
+    
+    # Create a random folder, shared by all of them, if not provided
+    if folder_id is None:
+        folder = create_random_bookmark_folder(db, user_id=user_id)
+        folder_id = folder.id
+    
+    # Built the same way as create_random_bookmark, just not committed one by one
+    bookmarks = [
+        crud_bookmark.bookmark.build(
+            obj_in=schemas.BookmarkCreate(
+                folder_id=folder_id,
+                type=random.choice(list(BookmarkType)).value,
+                notes=f"Test bookmark notes {uuid4()}",
+                tags=[f"tag-{i}" for i in range(random.randint(0, 3))],
+                internship_id=internship_id,
+                **kwargs
+            ),
+            user_id=user_id
+        )
+        for internship_id in internship_ids
+    ]
+    db.add_all(bookmarks)
+    db.flush()
+    return bookmarks
+
+
 def create_random_bookmark_folder(
     db: Session,
     user_id: int,
@@ -0,0 +1,12 @@
+from typing import List, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+def make_many(db: Session, objs: List[T]) -> List[T]:
+    """Insert several objects with one commit (attributes reload on next access)"""
+    db.add_all(objs)
+    db.commit()
+    return objs
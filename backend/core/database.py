@@ -1,24 +1,45 @@
 """
 Database connection and session management
 """
+from functools import lru_cache
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine, Session
-from .config import settings
+from .config import get_settings
 # Models will be imported by the modules that need them
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Create engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True
-)
+@lru_cache(maxsize=1)
+def get_engine():
+    """Create the database engine on first use"""
+    settings = get_settings()
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # An in-memory database lives as long as its one connection
+            return create_engine(url, echo=settings.debug)
+        # Opening a SQLite file is cheap and pooling only adds lock contention
+        return create_engine(
+            url,
+            echo=settings.debug,
+            poolclass=NullPool,
+            connect_args={"check_same_thread": False}
+        )
+    return create_engine(
+        url,
+        echo=settings.debug,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
 
 def create_db_and_tables():
     """Create database tables"""
     try:
-        SQLModel.metadata.create_all(engine)
+        SQLModel.metadata.create_all(get_engine())
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
@@ -26,5 +47,5 @@ def create_db_and_tables():
 
 def get_session():
     """Get database session"""
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
@@ -2,10 +2,14 @@
 SQLModel data models for EasyInterns v2
 Production-grade with proper indices and relationships
 """
-from sqlmodel import SQLModel, Field, Relationship, Index, Column, String, Text
+from sqlalchemy import JSON, PrimaryKeyConstraint, event, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
+from sqlmodel import SQLModel, Field, Relationship, Index, Column, Text
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+import textwrap
 import uuid
 
 
@@ -43,11 +47,21 @@ class ConfidenceLevel(str, Enum):
     LOW = "low"        # < 0.5
 
 
+# Lists and dicts are stored natively: JSONB on Postgres (indexable with GIN),
+# JSON elsewhere
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
 # Base Models
 class TimestampMixin(SQLModel):
     """Mixin for created_at and updated_at timestamps"""
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow, index=True)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 
 class User(TimestampMixin, table=True):
@@ -63,8 +77,8 @@ class User(TimestampMixin, table=True):
     city: Optional[str] = Field(default=None, index=True)
     region: Optional[str] = Field(default=None, index=True)  # Province/State
     country: str = Field(default="Canada", index=True)
-    fields_of_interest: List[FieldTag] = Field(default=[], sa_column=Column("fields_of_interest", String))
-    skills: List[str] = Field(default=[], sa_column=Column("skills", String))
+    fields_of_interest: List[FieldTag] = Field(default=[], sa_column=Column("fields_of_interest", _JSON))
+    skills: List[str] = Field(default=[], sa_column=Column("skills", _JSON))
     
     # Relationships
     resumes: List["Resume"] = Relationship(back_populates="user")
@@ -113,21 +127,36 @@ class Source(TimestampMixin, table=True):
     internships: List["Internship"] = Relationship(back_populates="source")
 
 
+# Full posting text; deferred so list queries don't load it (see Internship)
+_internship_description = Column("description", Text)
+
+# Length of Internship.description_snippet, shown in list views
+DESCRIPTION_SNIPPET_LENGTH = 280
+
+
 class Internship(TimestampMixin, table=True):
     """Core internship model with full-text search"""
     __tablename__ = "internships"
+    __mapper_args__ = {"properties": {"description": deferred(_internship_description)}}
     __table_args__ = (
         Index("idx_internship_search", "title", "description", postgresql_using="gin"),
-        Index("idx_internship_field_date", "field_tag", "posted_at"),
-        Index("idx_internship_location", "city", "region", "country"),
+        # Search filters by location and field, then sorts by posted_at; the
+        # included columns let Postgres answer list pages from the index
+        Index(
+            "idx_internship_search_combo",
+            "country", "region", "city", "field_tag", "posted_at",
+            postgresql_include=("relevance_score", "title", "company_id"),
+        ),
         Index("idx_internship_modality", "modality"),
+        Index("idx_internship_skills", "skills_required", postgresql_using="gin"),
     )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # Core fields
     title: str = Field(index=True)
-    description: str = Field(sa_column=Column("description", Text))
+    description: str = Field(sa_column=_internship_description)
+    description_snippet: Optional[str] = Field(default=None, max_length=DESCRIPTION_SNIPPET_LENGTH)
     field_tag: FieldTag = Field(index=True)
     
     # Location
@@ -149,7 +178,7 @@ class Internship(TimestampMixin, table=True):
     expires_at: Optional[datetime] = Field(default=None, index=True)
     
     # Metadata
-    skills_required: List[str] = Field(default=[], sa_column=Column("skills_required", String))
+    skills_required: List[str] = Field(default=[], sa_column=Column("skills_required", _JSON))
     education_level: Optional[str] = None  # "bachelor", "master", "phd", "diploma"
     experience_level: Optional[str] = None  # "entry", "junior", "mid", "senior"
     government_program: bool = Field(default=False, index=True)
@@ -161,12 +190,31 @@ class Internship(TimestampMixin, table=True):
     company_id: int = Field(foreign_key="companies.id", index=True)
     source_id: int = Field(foreign_key="sources.id", index=True)
     
-    # Relationships
-    company: Company = Relationship(back_populates="internships")
-    source: Source = Relationship(back_populates="internships")
+    # Relationships (the ones every response embeds load with one
+    # "WHERE id IN (...)" query per page instead of one query per row)
+    company: Company = Relationship(
+        back_populates="internships", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    source: Source = Relationship(
+        back_populates="internships", sa_relationship_kwargs={"lazy": "selectin"}
+    )
     bookmarks: List["Bookmark"] = Relationship(back_populates="internship")
     click_logs: List["ClickLog"] = Relationship(back_populates="internship")
-    contact_emails: List["ContactEmail"] = Relationship(back_populates="internship")
+    contact_emails: List["ContactEmail"] = Relationship(
+        back_populates="internship", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+
+
+@event.listens_for(Internship, "before_insert")
+@event.listens_for(Internship, "before_update")
+def _set_description_snippet(mapper, connection, target: Internship) -> None:
+    """Keep description_snippet in step with a newly set description"""
+    # Only look at description if it is loaded, so updates to other columns
+    # don't pull the deferred text in
+    if "description" in target.__dict__ and target.description:
+        target.description_snippet = textwrap.shorten(
+            target.description, DESCRIPTION_SNIPPET_LENGTH, placeholder="..."
+        )
 
 
 class ContactEmail(TimestampMixin, table=True):
@@ -175,6 +223,13 @@ class ContactEmail(TimestampMixin, table=True):
     __table_args__ = (
         Index("idx_contact_email_confidence", "confidence_score"),
         Index("idx_contact_email_unique", "email", "company_id", unique=True),
+        # Most emails belong to a company only, so index just the ones tied
+        # to an internship (a plain index elsewhere than Postgres)
+        Index(
+            "idx_contact_email_internship",
+            "internship_id",
+            postgresql_where=text("internship_id IS NOT NULL"),
+        ),
     )
     
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -193,7 +248,7 @@ class ContactEmail(TimestampMixin, table=True):
     
     # Foreign Keys
     company_id: int = Field(foreign_key="companies.id", index=True)
-    internship_id: Optional[int] = Field(foreign_key="internships.id", index=True)
+    internship_id: Optional[int] = Field(foreign_key="internships.id")
     
     # Relationships
     company: Company = Relationship(back_populates="contact_emails")
@@ -209,7 +264,7 @@ class Resume(TimestampMixin, table=True):
     template_key: str = Field(index=True)  # "ats_clean", "modern_two_col", etc.
     
     # Resume data (JSON)
-    json_data: dict = Field(default={}, sa_column=Column("json_data", String))
+    json_data: dict = Field(default={}, sa_column=Column("json_data", _JSON))
     
     # Generated files
     pdf_url: Optional[str] = None  # Supabase Storage URL
@@ -229,16 +284,12 @@ class Resume(TimestampMixin, table=True):
 class Bookmark(TimestampMixin, table=True):
     """User bookmarks for internships"""
     __tablename__ = "bookmarks"
-    __table_args__ = (
-        Index("idx_bookmark_unique", "user_id", "internship_id", unique=True),
-    )
     
-    id: Optional[int] = Field(default=None, primary_key=True)
     notes: Optional[str] = Field(default=None, sa_column=Column("notes", Text))
     
-    # Foreign Keys
-    user_id: int = Field(foreign_key="users.id", index=True)
-    internship_id: int = Field(foreign_key="internships.id", index=True)
+    # Foreign Keys (together the primary key: one bookmark per user and internship)
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    internship_id: int = Field(foreign_key="internships.id", primary_key=True, index=True)
     
     # Relationships
     user: User = Relationship(back_populates="bookmarks")
@@ -248,14 +299,18 @@ class Bookmark(TimestampMixin, table=True):
 class ClickLog(TimestampMixin, table=True):
     """User interaction tracking"""
     __tablename__ = "click_logs"
+    # An append-only event log needs no surrogate id
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "internship_id", "created_at", "action"),
+    )
     
-    id: Optional[int] = Field(default=None, primary_key=True)
-    action: str = Field(index=True)  # "view", "apply", "bookmark", "email_copy"
+    created_at: datetime = Field(default_factory=_utcnow, primary_key=True, index=True)
+    action: str = Field(primary_key=True, index=True)  # "view", "apply", "bookmark", "email_copy"
     click_metadata: Optional[str] = None  # JSON string for additional data
     
     # Foreign Keys
-    user_id: int = Field(foreign_key="users.id", index=True)
-    internship_id: int = Field(foreign_key="internships.id", index=True)
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    internship_id: int = Field(foreign_key="internships.id", primary_key=True, index=True)
     
     # Relationships
     user: User = Relationship(back_populates="click_logs")
@@ -51,8 +51,17 @@ class BookmarkCreate(BaseModel):
 
 
 # Response Schemas
-class CompanyResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class RowResponse(BaseModel):
+    """Response schema that can be built straight from a database row"""
+    
+    @classmethod
+    def from_row(cls, row: Any):
+        """Build from a trusted database row, skipping validation"""
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
+
+class CompanyResponse(RowResponse):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
     
     id: int
     name: str
@@ -67,7 +76,7 @@ class CompanyResponse(BaseModel):
 
 
 class ContactEmailResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", use_enum_values=True)
     
     id: int
     email: str
@@ -79,8 +88,8 @@ class ContactEmailResponse(BaseModel):
     mx_verified: bool
 
 
-class SourceResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class SourceResponse(RowResponse):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
     
     id: int
     name: str
@@ -88,12 +97,12 @@ class SourceResponse(BaseModel):
     source_type: str
 
 
-class InternshipResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class InternshipResponse(RowResponse):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", use_enum_values=True)
     
     id: int
     title: str
-    description: str
+    description_snippet: Optional[str] = None  # list views; the full text is on the detail response
     field_tag: FieldTag
     city: Optional[str]
     region: Optional[str]
@@ -116,12 +125,30 @@ class InternshipResponse(BaseModel):
     # Related objects
     company: CompanyResponse
     source: SourceResponse
+    
+    @classmethod
+    def from_row(cls, row: Any):
+        """Build from a trusted database row (with company and source loaded), skipping validation"""
+        fields = {
+            name: getattr(row, name)
+            for name in cls.model_fields
+            if name not in ("company", "source")
+        }
+        return cls.model_construct(
+            **fields,
+            company=CompanyResponse.from_row(row.company),
+            source=SourceResponse.from_row(row.source),
+        )
+
+
+class InternshipFullResponse(InternshipResponse):
+    description: str
 
 
 class InternshipDetailResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
     
-    internship: InternshipResponse
+    internship: InternshipFullResponse
     contact_emails: List[ContactEmailResponse]
     is_bookmarked: bool = False
 
@@ -150,7 +177,7 @@ class InternshipListResponse(BaseModel):
 
 
 class UserResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", use_enum_values=True)
     
     id: int
     email: str
@@ -164,7 +191,7 @@ class UserResponse(BaseModel):
 
 
 class ResumeResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
     
     id: int
     name: str
@@ -179,9 +206,9 @@ class ResumeResponse(BaseModel):
 
 
 class BookmarkResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
     
-    id: int
+    internship_id: int  # with the current user, the bookmark's key
     notes: Optional[str]
     created_at: datetime
     internship: InternshipResponse
@@ -5,20 +5,23 @@ FastAPI application with proper structure
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from typing import Dict
+import logging
 
 from backend.core.config import settings
 from backend.core.database import create_db_and_tables
-from backend.api import internships, users, resumes, scrape
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print(f"Starting EasyInterns v2 Backend - {settings.ENVIRONMENT}")
+    logger.info("Starting EasyInterns v2 Backend - %s", settings.ENVIRONMENT)
     create_db_and_tables()
     yield
     # Shutdown
-    print("Shutting down EasyInterns v2 Backend")
+    logger.info("Shutting down EasyInterns v2 Backend")
 
 
 app = FastAPI(
@@ -38,14 +41,24 @@ app.add_middleware(
 )
 
 # API Routes
-app.include_router(internships.router, prefix="/api", tags=["internships"])
-app.include_router(resumes.router, prefix="/api", tags=["resumes"])
-app.include_router(users.router, prefix="/api", tags=["users"])
-app.include_router(scrape.router, prefix="/api", tags=["scraping"])
+def _mount_routers(app: FastAPI) -> None:
+    """Import the API modules and mount their routers"""
+    # Imported here so the models, schemas and scrapers they pull in load
+    # while the app is assembled rather than as a side effect of the
+    # module-level imports above
+    from backend.api import internships, users, resumes, scrape
+    
+    app.include_router(internships.router, prefix="/api", tags=["internships"])
+    app.include_router(resumes.router, prefix="/api", tags=["resumes"])
+    app.include_router(users.router, prefix="/api", tags=["users"])
+    app.include_router(scrape.router, prefix="/api", tags=["scraping"])
+
+
+_mount_routers(app)
 
 
 @app.get("/")
-def root():
+def root() -> Dict[str, str]:
     return {
         "message": "EasyInterns v2 API",
         "version": "2.0.0",
@@ -55,7 +68,7 @@ def root():
 
 
 @app.get("/health")
-def health_check():
+def health_check() -> Dict[str, str]:
     return {
         "status": "healthy",
         "version": "2.0.0",
@@ -1,16 +1,358 @@
 """
-Job Bank Canada scraper using Playwright
+Job Bank Canada scraper using httpx, with Playwright for pages that need JavaScript
 """
 import asyncio
-from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Page
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+import httpx
+from playwright.async_api import async_playwright, Browser, Page, Playwright, Route
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from datetime import datetime, timedelta
 import re
+import time
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
 from backend.core.config import settings
 from backend.data.models import FieldTag, Modality
 
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+_DESCRIPTION_SEL = '.job-posting-detail-description'
+_REQUIREMENTS_SEL = '.job-posting-detail-requirements'
+
+INTERNSHIP_KEYWORDS = frozenset({
+    'intern', 'internship', 'co-op', 'coop', 'student',
+    'summer student', 'work term', 'placement'
+})
+_INTERNSHIP_RE = re.compile("|".join(map(re.escape, sorted(INTERNSHIP_KEYWORDS))), re.IGNORECASE)
+# Nothing the scraper reads needs these, so they are never fetched
+ANALYTICS_DOMAINS = ("google-analytics.com", "doubleclick.net", "googletagmanager.com", "adobedtm.com")
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+_SALARY_RE = re.compile(r'\$?([\d,]+)')
+_DAYS_RE = re.compile(r'(\d+)')
+_JOBID_RE = re.compile(r'/jobposting/(\d+)')
+
+# Common tech skills, paired with their lowercase form for matching
+_TECH_SKILLS = tuple((skill, skill.lower()) for skill in (
+    'Python', 'JavaScript', 'React', 'Node.js', 'Java', 'C++', 'C#',
+    'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Git', 'Docker',
+    'AWS', 'Azure', 'GCP', 'Kubernetes', 'Linux', 'HTML', 'CSS',
+    'TypeScript', 'Vue.js', 'Angular', 'Django', 'Flask', 'Spring',
+    'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Scikit-learn'
+))
+
+# Field keywords, checked in order; the first rule with a match wins
+_FIELD_RULES = (
+    (FieldTag.SOFTWARE_ENGINEERING, ('software', 'developer', 'programming', 'coding', 'engineer')),
+    (FieldTag.DATA_SCIENCE, ('data', 'analytics', 'machine learning', 'ai', 'scientist')),
+    (FieldTag.PRODUCT_MANAGEMENT, ('product', 'pm', 'product manager')),
+    (FieldTag.DESIGN_UX_UI, ('design', 'ui', 'ux', 'designer')),
+    (FieldTag.MARKETING, ('marketing', 'digital marketing', 'content')),
+    (FieldTag.FINANCE, ('finance', 'financial', 'accounting')),
+    (FieldTag.SALES, ('sales', 'business development')),
+    (FieldTag.OPERATIONS, ('operations', 'ops', 'logistics')),
+)
+
+_MODALITY_RULES = (
+    (Modality.REMOTE, ('remote', 'work from home', 'telecommute')),
+    (Modality.HYBRID, ('hybrid', 'flexible', 'remote and office')),
+)
+
+
+def _rule_automaton(rules: tuple):
+    """Aho-Corasick automaton mapping each keyword to (rule index, value); None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (value, keywords) in enumerate(rules):
+        for keyword in keywords:
+            if keyword not in automaton:
+                automaton.add_word(keyword, (priority, value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_rules(text_lower: str, rules: tuple, automaton, default):
+    """Value of the first rule with a keyword in text_lower, scanning the text once if possible"""
+    if automaton is not None:
+        best = min((match for _, match in automaton.iter(text_lower)), key=lambda match: match[0], default=None)
+        return best[1] if best is not None else default
+    for value, keywords in rules:
+        if any(word in text_lower for word in keywords):
+            return value
+    return default
+
+
+def _skill_automaton():
+    """Aho-Corasick automaton mapping each lowercase skill to its index in _TECH_SKILLS"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (_, skill_lower) in enumerate(_TECH_SKILLS):
+        automaton.add_word(skill_lower, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _skill_automaton()
+_FIELD_AUTOMATON = _rule_automaton(_FIELD_RULES)
+_MODALITY_AUTOMATON = _rule_automaton(_MODALITY_RULES)
+
+
+def _css_text(node: LexborNode, selector: str, default: str = "") -> str:
+    """Text of the first match for selector under node, or default"""
+    element = node.css_first(selector)
+    return element.text() if element else default
+
+
+async def _block_unneeded(route: Route) -> None:
+    """Abort requests for assets and analytics; let everything else through"""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(d in request.url for d in ANALYTICS_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _wait_settled(page: Page, idle_ms: int = 500, timeout_ms: int = 5000) -> None:
+    """Wait until the page has had no requests in flight for idle_ms (gives up after timeout_ms)"""
+    pending = set()
+    last_activity = time.monotonic()
+    
+    def on_request(request):
+        nonlocal last_activity
+        pending.add(request)
+        last_activity = time.monotonic()
+    
+    def on_done(request):
+        nonlocal last_activity
+        pending.discard(request)
+        last_activity = time.monotonic()
+    
+    page.on("request", on_request)
+    page.on("requestfinished", on_done)
+    page.on("requestfailed", on_done)
+    try:
+        deadline = time.monotonic() + timeout_ms / 1000
+        while time.monotonic() < deadline:
+            if not pending and time.monotonic() - last_activity >= idle_ms / 1000:
+                return
+            await asyncio.sleep(0.05)
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("requestfinished", on_done)
+        page.remove_listener("requestfailed", on_done)
+
+
+class _BrowserPool:
+    """Chromium instances kept alive across scrape sessions, relaunched every max_uses sessions"""
+    
+    def __init__(self, size: int, max_uses: int):
+        self.size = size
+        self.max_uses = max_uses
+        self._playwright: Optional[Playwright] = None
+        # The pool is module-level, so its asyncio state is made on first use
+        # from each event loop rather than bound to whichever loop imports it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: Optional[asyncio.Queue] = None
+        # Sessions served per live browser (plus placeholders for launches in flight)
+        self._uses: Dict[object, int] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        
+    def _bind_loop(self) -> None:
+        """Set up the pool's state for the running loop if it was last used from another"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Browsers from an earlier loop can't be driven from this one
+            self._loop = loop
+            self._playwright = None
+            self._idle = asyncio.Queue()
+            self._uses = {}
+            self._lock = asyncio.Lock()
+        
+    async def _launch(self) -> Browser:
+        """Start a browser, starting Playwright itself on first use"""
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=True)
+        self._uses[browser] = 0
+        return browser
+    
+    async def acquire(self) -> Browser:
+        """Take an idle browser, launching one if the pool isn't full yet"""
+        self._bind_loop()
+        if self._idle.empty() and len(self._uses) < self.size:
+            # Reserve the slot before awaiting the launch
+            placeholder = object()
+            self._uses[placeholder] = 0
+            try:
+                return await self._launch()
+            finally:
+                del self._uses[placeholder]
+        return await self._idle.get()
+    
+    async def release(self, browser: Browser) -> None:
+        """Hand a browser back, replacing it once it has served max_uses sessions"""
+        self._uses[browser] += 1
+        if self._uses[browser] < self.max_uses and browser.is_connected():
+            self._idle.put_nowait(browser)
+            return
+        
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning("Error closing browser: %s", e)
+        # Relaunch right away so sessions waiting on the queue aren't starved;
+        # the old entry keeps the slot reserved until the new browser is up
+        try:
+            self._idle.put_nowait(await self._launch())
+        finally:
+            del self._uses[browser]
+    
+    async def close(self) -> None:
+        """Close idle browsers and stop Playwright"""
+        if self._loop is not asyncio.get_running_loop():
+            return  # nothing started from this loop
+        while not self._idle.empty():
+            browser = self._idle.get_nowait()
+            self._uses.pop(browser, None)
+            await browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_pool = _BrowserPool(
+    size=int(os.environ.get("JOBBANK_BROWSER_POOL_SIZE", 2)),
+    max_uses=50,
+)
+
+
+async def close_browser_pool() -> None:
+    """Close the shared browsers (call at shutdown)"""
+    await _pool.close()
+
+
+class _TabPool:
+    """Browser tabs for detail pages that need JavaScript, opened on first use"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._browser: Optional[Browser] = None
+        self._context = None
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._opened = 0
+        self._lock = asyncio.Lock()
+        
+    async def get(self) -> Page:
+        """Check out a tab, starting the browser session if this is the first"""
+        async with self._lock:
+            if self._context is None:
+                # Browsers are pooled across sessions; each session gets its own context
+                browser = await _pool.acquire()
+                try:
+                    context = await browser.new_context(user_agent=_USER_AGENT)
+                    await context.route("**/*", _block_unneeded)
+                except Exception:
+                    await _pool.release(browser)
+                    raise
+                self._browser, self._context = browser, context
+            if self._idle.empty() and self._opened < self.size:
+                self._opened += 1
+                tab = await self._context.new_page()
+                # Fail fast rather than waiting out Playwright's 30s defaults
+                tab.set_default_timeout(5000)
+                tab.set_default_navigation_timeout(8000)
+                return tab
+        return await self._idle.get()
+    
+    def put(self, tab: Page) -> None:
+        """Return a tab for the next job (tabs are reused until close())"""
+        self._idle.put_nowait(tab)
+    
+    async def close(self) -> None:
+        """Close the session's context and hand the browser back to the pool"""
+        if self._context is None:
+            return
+        try:
+            await self._context.close()
+        finally:
+            await _pool.release(self._browser)
+            self._browser = self._context = None
+
+
+class _Pacer:
+    """Spaces requests at least `interval` seconds apart, in arrival order"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+        
+    async def wait(self) -> None:
+        """Sleep until the next request is due"""
+        async with self._lock:
+            delay = self._next - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next = time.monotonic() + self.interval
+
+
+class _DetailCache:
+    """SQLite-backed store of parsed detail pages, so repeat crawls skip unchanged postings"""
+    
+    def __init__(self, path: Path, ttl: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        # Used from worker threads (see aget/aset), one call at a time
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_details (key TEXT PRIMARY KEY, ts REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        
+    def get(self, key: str) -> Optional[tuple]:
+        """(description, skills, modality) for key, or None if missing or stale"""
+        with self._lock:
+            row = self._db.execute("SELECT ts, data FROM job_details WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        description, skills, modality = orjson.loads(row[1])
+        return description, skills, Modality(modality)
+    
+    def set(self, key: str, details: tuple) -> None:
+        """Store (description, skills, modality) for key"""
+        description, skills, modality = details
+        data = orjson.dumps([description, skills, modality.value])
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO job_details (key, ts, data) VALUES (?, ?, ?)",
+                (key, time.time(), data),
+            )
+    
+    async def aget(self, key: str) -> Optional[tuple]:
+        """get() in a worker thread, so disk I/O doesn't block the event loop"""
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, details: tuple) -> None:
+        """set() in a worker thread, so disk I/O doesn't block the event loop"""
+        await asyncio.to_thread(self.set, key, details)
+
 
 class JobBankCanadaScraper:
     """Scraper for Job Bank Canada internships"""
@@ -18,109 +360,145 @@ class JobBankCanadaScraper:
     def __init__(self):
         self.base_url = "https://www.jobbank.gc.ca"
         self.search_url = f"{self.base_url}/jobsearch/jobsearch"
-        self.cooldown = 2  # seconds between requests
+        self.cooldown = 2  # seconds between result pages
+        # Seconds between detail page requests, by default the same spacing as result pages
+        self.detail_interval = float(os.environ.get("JOBBANK_DETAIL_INTERVAL", self.cooldown))
+        # Listings extracted at once (HTTP connections, or browser tabs for
+        # pages that need JavaScript)
+        self.concurrency = int(os.environ.get("JOBBANK_CONCURRENT_TABS", 5))
+        self.detail_timeout = 10  # seconds allowed per detail page load (HTTP GET, or browser render)
+        self.cache = _DetailCache(settings.CACHE_DIR / "jobbank.sqlite3", ttl=settings.SCRAPER_CACHE_TTL)
+        self._seen = set()  # postings already extracted in the current crawl
+        self._pacer: Optional[_Pacer] = None  # paces the current crawl's detail requests
         
     async def scrape_internships(self, max_pages: int = 5) -> List[Dict]:
         """Scrape internships from Job Bank Canada"""
-        internships = []
+        return [internship async for internship in self.iter_internships(max_pages)]
+    
+    async def iter_internships(self, max_pages: int = 5) -> AsyncIterator[Dict]:
+        """Yield internships from Job Bank Canada as soon as each one is extracted"""
+        self._seen = set()
+        self._pacer = _Pacer(self.detail_interval)
+        # Bounded, so a slow consumer holds the crawl back instead of it buffering
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
-            
-            try:
-                # Search for internships
-                await page.goto(self.search_url)
-                await page.wait_for_load_state("networkidle")
-                
-                # Fill search form
-                await page.fill('input[name="searchstring"]', "intern")
-                await page.select_option('select[name="sort"]', "M")  # Most recent
+        # Result pages are server-rendered, so plain HTTP is enough for them;
+        # a browser is only started if some detail page needs one
+        tabs = _TabPool(self.concurrency)
+        try:
+            async with httpx.AsyncClient(
+                headers={"User-Agent": _USER_AGENT},
+                timeout=settings.SCRAPER_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_connections=self.concurrency),
+            ) as client:
+                producer = asyncio.create_task(self._crawl(client, tabs, queue, max_pages))
+                try:
+                    while (internship := await queue.get()) is not None:
+                        yield internship
+                finally:
+                    # The consumer may stop early; don't leave the crawl running
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
+        finally:
+            await tabs.close()
+    
+    async def _crawl(self, client: httpx.AsyncClient, tabs: _TabPool, queue: asyncio.Queue, max_pages: int) -> None:
+        """Walk the result pages, queueing internships and then a None sentinel"""
+        try:
+            # Scrape multiple pages
+            for page_num in range(1, max_pages + 1):
+                logger.debug("Scraping page %d", page_num)
                 
-                # Submit search
-                await page.click('button[type="submit"]')
-                await page.wait_for_load_state("networkidle")
+                tree = LexborHTMLParser(await self._fetch_listing(client, page_num))
+                await self._scrape_page(tree, client, tabs, queue)
                 
-                # Scrape multiple pages
-                for page_num in range(1, max_pages + 1):
-                    print(f"Scraping page {page_num}...")
-                    
-                    page_internships = await self._scrape_page(page)
-                    internships.extend(page_internships)
+                # Check for next page
+                if not tree.css_first('a[aria-label="Next page"]') or page_num >= max_pages:
+                    break
                     
-                    # Check for next page
-                    next_button = await page.query_selector('a[aria-label="Next page"]')
-                    if not next_button or page_num >= max_pages:
-                        break
-                        
-                    await next_button.click()
-                    await page.wait_for_load_state("networkidle")
-                    await asyncio.sleep(self.cooldown)
-                    
-            except Exception as e:
-                print(f"Error scraping Job Bank Canada: {e}")
-            finally:
-                await browser.close()
+                await asyncio.sleep(self.cooldown)
                 
-        return internships
+        except asyncio.CancelledError:
+            # Cancelled by the consumer, which no longer reads the queue; a
+            # sentinel put here could block forever on a full queue
+            raise
+        except Exception:
+            logger.exception("Error scraping Job Bank Canada")
+        await queue.put(None)
     
-    async def _scrape_page(self, page: Page) -> List[Dict]:
-        """Scrape internships from current page"""
-        internships = []
-        
-        # Get job listings
-        job_elements = await page.query_selector_all('.resultJobItem')
+    async def _fetch_listing(self, client: httpx.AsyncClient, page_num: int) -> str:
+        """Fetch one page of search results (most recent internships first)"""
+        params = {"searchstring": "intern", "sort": "M", "page": page_num}
+        response = await client.get(self.search_url, params=params)
+        response.raise_for_status()
+        return response.text
+    
+    async def _scrape_page(
+        self, tree: LexborHTMLParser, client: httpx.AsyncClient, tabs: _TabPool, queue: asyncio.Queue
+    ) -> None:
+        """Queue the internships on a parsed results page as each one is extracted"""
+        # HTTP/2 multiplexes every request over one connection, so the client's
+        # connection limit doesn't bound concurrency; this does
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        for job_element in job_elements:
+        async def extract(job_element: LexborNode) -> None:
             try:
-                internship = await self._extract_job_data(page, job_element)
-                if internship and self._is_internship(internship):
-                    internships.append(internship)
-            except Exception as e:
-                print(f"Error extracting job data: {e}")
-                continue
-                
-        return internships
+                async with semaphore:
+                    internship = await self._extract_job_data(client, tabs, job_element)
+            except Exception:
+                logger.exception("Error extracting job data")
+                return
+            if internship:
+                await queue.put(internship)
+        
+        await asyncio.gather(*(extract(job_element) for job_element in tree.css('.resultJobItem')))
     
-    async def _extract_job_data(self, page: Page, job_element) -> Optional[Dict]:
-        """Extract data from a single job element"""
+    async def _extract_job_data(
+        self, client: httpx.AsyncClient, tabs: _TabPool, job_element: LexborNode
+    ) -> Optional[Dict]:
+        """Extract data from a single parsed job element"""
         try:
             # Title and link
-            title_element = await job_element.query_selector('.resultJobItemTitle a')
+            title_element = job_element.css_first('.resultJobItemTitle a')
             if not title_element:
                 return None
                 
-            title = await title_element.inner_text()
-            job_url = await title_element.get_attribute('href')
+            title = title_element.text()
+            # Only internship-looking titles are worth a detail-page visit
+            if not _INTERNSHIP_RE.search(title):
+                return None
+            job_url = title_element.attributes.get('href')
             if job_url:
                 job_url = urljoin(self.base_url, job_url)
+                # Results can repeat across pages; don't extract a posting twice
+                job_key = self._extract_job_id(job_url) or job_url
+                if job_key in self._seen:
+                    return None
+                self._seen.add(job_key)
             
             # Company
-            company_element = await job_element.query_selector('.resultJobItemCompany')
-            company = await company_element.inner_text() if company_element else "Unknown"
+            company = _css_text(job_element, '.resultJobItemCompany', "Unknown")
             
             # Location
-            location_element = await job_element.query_selector('.resultJobItemLocation')
-            location = await location_element.inner_text() if location_element else ""
+            location = _css_text(job_element, '.resultJobItemLocation')
             city, region = self._parse_location(location)
             
             # Salary
-            salary_element = await job_element.query_selector('.resultJobItemWage')
-            salary_text = await salary_element.inner_text() if salary_element else ""
+            salary_text = _css_text(job_element, '.resultJobItemWage')
             salary_min, salary_max = self._parse_salary(salary_text)
             
             # Posted date
-            date_element = await job_element.query_selector('.resultJobItemDate')
-            date_text = await date_element.inner_text() if date_element else ""
+            date_text = _css_text(job_element, '.resultJobItemDate')
             posted_at = self._parse_date(date_text)
             
             # Get job details by visiting the job page
-            description, skills, modality = await self._get_job_details(page, job_url)
+            description, skills, modality = await self._get_job_details(client, tabs, job_url)
+            # Lowercased once for the keyword checks below
+            lower_text = f"{title} {description}".lower()
             
-            return {
+            internship = {
                 'title': title.strip(),
                 'company_name': company.strip(),
                 'description': description,
@@ -134,60 +512,91 @@ class JobBankCanadaScraper:
                 'apply_url': job_url,
                 'posted_at': posted_at,
                 'skills_required': skills,
-                'field_tag': self._classify_field(title, description),
+                'field_tag': self._classify_field(title, description, lower_text=lower_text),
                 'source_name': 'job_bank_ca',
                 'external_id': self._extract_job_id(job_url)
             }
+            return internship if self._is_internship(internship, lower_text=lower_text) else None
             
-        except Exception as e:
-            print(f"Error extracting job data: {e}")
+        except Exception:
+            logger.exception("Error extracting job data")
             return None
     
-    async def _get_job_details(self, page: Page, job_url: str) -> tuple:
+    async def _get_job_details(self, client: httpx.AsyncClient, tabs: _TabPool, job_url: str) -> tuple:
         """Get detailed job information"""
         if not job_url:
             return "", [], Modality.ON_SITE
+        
+        # Postings rarely change, so a fresh cached parse skips the page load
+        key = self._extract_job_id(job_url) or hashlib.sha1(job_url.encode()).hexdigest()
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return cached
             
         try:
-            # Open job page in new tab
-            new_page = await page.context.new_page()
-            await new_page.goto(job_url)
-            await new_page.wait_for_load_state("networkidle")
-            
-            # Description
-            desc_element = await new_page.query_selector('.job-posting-detail-description')
-            description = await desc_element.inner_text() if desc_element else ""
+            await self._pacer.wait()
+            description, req_text = await self._fetch_job_details(client, tabs, job_url)
             
             # Skills (look for requirements section)
-            skills = []
-            requirements_element = await new_page.query_selector('.job-posting-detail-requirements')
-            if requirements_element:
-                req_text = await requirements_element.inner_text()
-                skills = self._extract_skills(req_text)
+            skills = self._extract_skills(req_text) if req_text else []
             
             # Work modality
             modality = self._determine_modality(description)
             
-            await new_page.close()
-            await asyncio.sleep(self.cooldown)
-            
-            return description.strip(), skills, modality
+            details = (description.strip(), skills, modality)
+            await self.cache.aset(key, details)
+            return details
             
-        except Exception as e:
-            print(f"Error getting job details: {e}")
+        except asyncio.TimeoutError:
+            logger.warning("Timed out getting job details for %s", job_url)
+            return "", [], Modality.ON_SITE
+        except Exception:
+            logger.exception("Error getting job details for %s", job_url)
             return "", [], Modality.ON_SITE
     
-    def _is_internship(self, job_data: Dict) -> bool:
-        """Check if job is an internship"""
-        title = job_data.get('title', '').lower()
-        description = job_data.get('description', '').lower()
+    async def _fetch_job_details(self, client: httpx.AsyncClient, tabs: _TabPool, job_url: str) -> Tuple[str, str]:
+        """Description and requirements text of a detail page"""
+        # Bound each page load so one stuck page can't hold up the crawl
+        response = await asyncio.wait_for(client.get(job_url), timeout=self.detail_timeout)
+        response.raise_for_status()
+        tree = LexborHTMLParser(response.content)
         
-        internship_keywords = [
-            'intern', 'internship', 'co-op', 'coop', 'student', 
-            'summer student', 'work term', 'placement'
-        ]
+        desc_element = tree.css_first(_DESCRIPTION_SEL)
+        if desc_element is None:
+            # Not in the served HTML, so the page is rendered client-side
+            return await self._render_job_details(tabs, job_url)
+        return desc_element.text(), _css_text(tree.root, _REQUIREMENTS_SEL)
+    
+    async def _render_job_details(self, tabs: _TabPool, job_url: str) -> Tuple[str, str]:
+        """Description and requirements text of a detail page loaded in a browser tab"""
+        tab = await tabs.get()
+        try:
+            # Timed from here, so waiting for a tab or a browser launch doesn't count
+            return await asyncio.wait_for(self._read_tab(tab, job_url), timeout=self.detail_timeout)
+        finally:
+            tabs.put(tab)
+    
+    async def _read_tab(self, tab: Page, job_url: str) -> Tuple[str, str]:
+        """Load a detail page in a tab and read its description and requirements text"""
+        await tab.goto(job_url, wait_until="domcontentloaded")
+        await _wait_settled(tab)
         
-        return any(keyword in title or keyword in description for keyword in internship_keywords)
+        desc_element = await tab.query_selector(_DESCRIPTION_SEL)
+        description = await desc_element.inner_text() if desc_element else ""
+        
+        requirements_element = await tab.query_selector(_REQUIREMENTS_SEL)
+        req_text = await requirements_element.inner_text() if requirements_element else ""
+        
+        return description, req_text
+    
+    def _is_internship(self, job_data: Dict, lower_text: Optional[str] = None) -> bool:
+        """Check if job is an internship (lower_text: title and description, already lowercased)"""
+        if lower_text is not None:
+            return bool(_INTERNSHIP_RE.search(lower_text))
+        return bool(
+            _INTERNSHIP_RE.search(job_data.get('title', ''))
+            or _INTERNSHIP_RE.search(job_data.get('description', ''))
+        )
     
     def _parse_location(self, location_text: str) -> tuple:
         """Parse location into city and region"""
@@ -212,7 +621,7 @@ class JobBankCanadaScraper:
             return None, None
             
         # Extract numbers from salary text
-        numbers = re.findall(r'\$?([\d,]+)', salary_text)
+        numbers = _SALARY_RE.findall(salary_text)
         if not numbers:
             return None, None
             
@@ -234,18 +643,19 @@ class JobBankCanadaScraper:
         if not date_text:
             return None
             
+        date_lower = date_text.lower()
         try:
             # Handle "X days ago" format
-            if 'day' in date_text.lower():
-                days_match = re.search(r'(\d+)', date_text)
+            if 'day' in date_lower:
+                days_match = _DAYS_RE.search(date_text)
                 if days_match:
                     days_ago = int(days_match.group(1))
                     return datetime.now() - timedelta(days=days_ago)
             
             # Handle "today" or "yesterday"
-            if 'today' in date_text.lower():
+            if 'today' in date_lower:
                 return datetime.now()
-            elif 'yesterday' in date_text.lower():
+            elif 'yesterday' in date_lower:
                 return datetime.now() - timedelta(days=1)
                 
         except Exception:
@@ -253,59 +663,32 @@ class JobBankCanadaScraper:
             
         return None
     
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills from job description"""
-        skills = []
-        
-        # Common tech skills
-        tech_skills = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'Java', 'C++', 'C#',
-            'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Git', 'Docker',
-            'AWS', 'Azure', 'GCP', 'Kubernetes', 'Linux', 'HTML', 'CSS',
-            'TypeScript', 'Vue.js', 'Angular', 'Django', 'Flask', 'Spring',
-            'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Scikit-learn'
-        ]
+    def _extract_skills(self, text: str, lower_text: Optional[str] = None) -> List[str]:
+        """Extract skills from job description (lower_text: text, already lowercased)"""
+        text_lower = lower_text if lower_text is not None else text.lower()
+        if _SKILL_AUTOMATON is not None:
+            # One pass over the text; skills keep their list order
+            found = {index for _, index in _SKILL_AUTOMATON.iter(text_lower)}
+            return [_TECH_SKILLS[index][0] for index in sorted(found)[:10]]
         
-        text_lower = text.lower()
-        for skill in tech_skills:
-            if skill.lower() in text_lower:
+        skills = []
+        for skill, skill_lower in _TECH_SKILLS:
+            if skill_lower in text_lower:
                 skills.append(skill)
+                if len(skills) == 10:  # Limit to 10 skills
+                    break
                 
-        return skills[:10]  # Limit to 10 skills
+        return skills
     
-    def _classify_field(self, title: str, description: str) -> FieldTag:
-        """Classify internship field based on title and description"""
-        text = f"{title} {description}".lower()
-        
-        if any(word in text for word in ['software', 'developer', 'programming', 'coding', 'engineer']):
-            return FieldTag.SOFTWARE_ENGINEERING
-        elif any(word in text for word in ['data', 'analytics', 'machine learning', 'ai', 'scientist']):
-            return FieldTag.DATA_SCIENCE
-        elif any(word in text for word in ['product', 'pm', 'product manager']):
-            return FieldTag.PRODUCT_MANAGEMENT
-        elif any(word in text for word in ['design', 'ui', 'ux', 'designer']):
-            return FieldTag.DESIGN_UX_UI
-        elif any(word in text for word in ['marketing', 'digital marketing', 'content']):
-            return FieldTag.MARKETING
-        elif any(word in text for word in ['finance', 'financial', 'accounting']):
-            return FieldTag.FINANCE
-        elif any(word in text for word in ['sales', 'business development']):
-            return FieldTag.SALES
-        elif any(word in text for word in ['operations', 'ops', 'logistics']):
-            return FieldTag.OPERATIONS
-        else:
-            return FieldTag.OTHER
-    
-    def _determine_modality(self, description: str) -> Modality:
-        """Determine work modality from description"""
-        desc_lower = description.lower()
-        
-        if any(word in desc_lower for word in ['remote', 'work from home', 'telecommute']):
-            return Modality.REMOTE
-        elif any(word in desc_lower for word in ['hybrid', 'flexible', 'remote and office']):
-            return Modality.HYBRID
-        else:
-            return Modality.ON_SITE
+    def _classify_field(self, title: str, description: str, lower_text: Optional[str] = None) -> FieldTag:
+        """Classify internship field based on title and description (lower_text: both, already lowercased)"""
+        text = lower_text if lower_text is not None else f"{title} {description}".lower()
+        return _match_rules(text, _FIELD_RULES, _FIELD_AUTOMATON, FieldTag.OTHER)
+    
+    def _determine_modality(self, description: str, lower_text: Optional[str] = None) -> Modality:
+        """Determine work modality from description (lower_text: description, already lowercased)"""
+        text = lower_text if lower_text is not None else description.lower()
+        return _match_rules(text, _MODALITY_RULES, _MODALITY_AUTOMATON, Modality.ON_SITE)
     
     def _extract_job_id(self, job_url: str) -> Optional[str]:
         """Extract job ID from URL"""
@@ -313,14 +696,17 @@ class JobBankCanadaScraper:
             return None
             
         # Extract ID from URL pattern
-        match = re.search(r'/jobposting/(\d+)', job_url)
+        match = _JOBID_RE.search(job_url)
         return match.group(1) if match else None
 
 
 async def main():
     """Test the scraper"""
     scraper = JobBankCanadaScraper()
-    internships = await scraper.scrape_internships(max_pages=2)
+    try:
+        internships = await scraper.scrape_internships(max_pages=2)
+    finally:
+        await close_browser_pool()
     
     print(f"Found {len(internships)} internships")
     for internship in internships[:3]:  # Show first 3
@@ -25,10 +25,12 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create the test database and tables
-Base.metadata.create_all(bind=engine)
+def pytest_configure(config):
+    """Create the test database tables once pytest is actually running."""
+    Base.metadata.create_all(bind=engine)
 
 # Override the get_db dependency to use our test database
 def override_get_db():
@@ -41,19 +43,21 @@ def override_get_db():
 # Apply the override
 app.dependency_overrides[get_db] = override_get_db
 
-# Create test client
-client = TestClient(app)
-
 # Fixtures
 @pytest.fixture(scope="session")
+def client():
+    """Test client shared by the whole session, so the app starts up once."""
+    with TestClient(app) as c:
+        yield c
+
+@pytest.fixture
 def db():
-    """Create a new database session for a test."""
+    """Create a new database session for a test, rolled back when it ends."""
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
-
-    # Create the tables
-    Base.metadata.create_all(bind=connection)
+    # Commits inside the test release a SAVEPOINT rather than the outer
+    # transaction, so the rollback below undoes everything the test wrote
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
@@ -62,21 +66,27 @@ def db():
     transaction.rollback()
     connection.close()
 
-@pytest.fixture
-def test_user(db):
-    """Create a test user."""
-    user = User(
-        email="test@example.com",
-        hashed_password=get_password_hash("testpassword"),
-        full_name="Test User",
-        is_active=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+@pytest.fixture(scope="session")
+def test_user():
+    """Create a test user, committed once for the whole session."""
+    # Session-scoped fixtures are set up before the per-test transaction in
+    # `db` starts, so this commit is not rolled back with it
+    session = TestingSessionLocal()
+    try:
+        user = User(
+            email="test@example.com",
+            hashed_password=get_password_hash("testpassword"),
+            full_name="Test User",
+            is_active=True,
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+    finally:
+        session.close()
     return user
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def normal_user_token_headers(test_user):
     """Get a token for the test user."""
     from app.core.security import create_access_token
@@ -4,17 +4,16 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from app.main import app
 from app.core.config import settings
+from app.models.application import Application
 from app.tests.utils.user import create_random_user, authentication_token_from_email
 from app.tests.utils.internship import create_random_internship
 from app.tests.utils.resume import create_random_resume
 from app.tests.utils.application import create_random_application
-
-client = TestClient(app)
+from app.tests.utils.db import make_many
 
 def test_create_application(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test creating a new application"""
     # Create test data
@@ -49,7 +48,7 @@ def test_create_application(
 
 
 def test_read_application(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test reading an application"""
     # Create test data
@@ -68,7 +67,7 @@ def test_read_application(
 
 
 def test_update_application(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test updating an application"""
     # Create test data
@@ -96,7 +95,7 @@ def test_update_application(
 
 
 def test_delete_application(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test deleting an application"""
     # Create test data
@@ -121,7 +120,7 @@ def test_delete_application(
 
 
 def test_update_application_status(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test updating an application's status"""
     # Create test data
@@ -146,7 +145,7 @@ def test_update_application_status(
 
 
 def test_add_application_activity(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test adding an activity to an application"""
     # Create test data
@@ -176,17 +175,26 @@ def test_add_application_activity(
 
 
 def test_get_application_stats(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test getting application statistics"""
     # Create test data
     user_id = 1  # Will be set by the auth middleware
     
-    # Create applications with different statuses
-    create_random_application(db, user_id=user_id, status="applied")
-    create_random_application(db, user_id=user_id, status="applied")
-    create_random_application(db, user_id=user_id, status="interviewing")
-    create_random_application(db, user_id=user_id, status="rejected")
+    # Create applications with different statuses, inserted together
+    internship = create_random_internship(db)
+    resume = create_random_resume(db, user_id=user_id)
+    make_many(db, [
+        Application(
+            user_id=user_id,
+            internship_id=internship.id,
+            resume_id=resume.id,
+            status=status,
+            stage="application",
+            source="company_website",
+        )
+        for status in ("applied", "applied", "interviewing", "rejected")
+    ])
     
     response = client.get(
         f"{settings.API_V1_STR}/applications/stats/overview",
@@ -202,7 +210,7 @@ def test_get_application_stats(
 
 
 def test_get_upcoming_activities(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test getting upcoming activities"""
     # Create test data
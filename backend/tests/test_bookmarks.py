@@ -4,21 +4,19 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
-from app.main import app
 from app.core.config import settings
 from app.tests.utils.user import create_random_user, authentication_token_from_email
 from app.tests.utils.bookmark import (
     create_random_bookmark, 
+    create_random_bookmarks,
     create_random_bookmark_folder,
     add_bookmark_reminder,
     add_bookmark_tag,
     process_bulk_bookmark_action
 )
 
-client = TestClient(app)
-
 def test_create_bookmark(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test creating a new bookmark"""
     # Create test data
@@ -53,7 +51,7 @@ def test_create_bookmark(
 
 
 def test_read_bookmark(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test reading a bookmark"""
     # Create test data
@@ -72,7 +70,7 @@ def test_read_bookmark(
 
 
 def test_update_bookmark(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test updating a bookmark"""
     # Create test data
@@ -103,7 +101,7 @@ def test_update_bookmark(
 
 
 def test_delete_bookmark(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test deleting a bookmark"""
     # Create test data
@@ -128,7 +126,7 @@ def test_delete_bookmark(
 
 
 def test_add_reminder(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test adding a reminder to a bookmark"""
     # Create test data
@@ -149,7 +147,7 @@ def test_add_reminder(
 
 
 def test_bulk_update_bookmarks(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test bulk updating bookmarks"""
     # Create test data
@@ -158,9 +156,9 @@ def test_bulk_update_bookmarks(
     folder2 = create_random_bookmark_folder(db, user_id=user_id, name="Folder 2")
     
     # Create some bookmarks
-    bookmark1 = create_random_bookmark(db, user_id=user_id, folder_id=folder1.id)
-    bookmark2 = create_random_bookmark(db, user_id=user_id, folder_id=folder1.id)
-    bookmark3 = create_random_bookmark(db, user_id=user_id, folder_id=folder1.id)
+    bookmark1, bookmark2, bookmark3 = create_random_bookmarks(
+        db, user_id=user_id, n=3, folder_id=folder1.id
+    )
     
     # Test moving bookmarks to another folder
     response = client.post(
@@ -212,17 +210,15 @@ def test_bulk_update_bookmarks(
 
 
 def test_get_upcoming_reminders(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test getting upcoming reminders"""
     # Create test data
     user_id = 1  # Will be set by the auth middleware
     
     # Create bookmarks with reminders
-    bookmark1 = create_random_bookmark(db, user_id=user_id)
+    bookmark1, bookmark2 = create_random_bookmarks(db, user_id=user_id, n=2)
     bookmark1 = add_bookmark_reminder(db, bookmark1.id, user_id, days=1)  # Due tomorrow
-    
-    bookmark2 = create_random_bookmark(db, user_id=user_id)
     bookmark2 = add_bookmark_reminder(db, bookmark2.id, user_id, days=7)  # Due in a week
     
     # Get upcoming reminders (next 3 days)
@@ -239,7 +235,7 @@ def test_get_upcoming_reminders(
 
 
 def test_bookmark_folders_crud(
-    db: Session, normal_user_token_headers: Dict[str, str]
+    client: TestClient, db: Session, normal_user_token_headers: Dict[str, str]
 ) -> None:
     """Test CRUD operations for bookmark folders"""
     # Create a folder
@@ -355,9 +355,9 @@ function InternshipCard({
             )}
           </div>
           
-          {internship.description && (
+          {internship.description_snippet && (
             <p className="text-sm text-gray-700 line-clamp-2">
-              {internship.description}
+              {internship.description_snippet}
             </p>
           )}
         </div>
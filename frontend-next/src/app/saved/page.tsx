@@ -119,7 +119,7 @@ export default function SavedPage() {
             <div className="space-y-4">
               {filteredBookmarks.map((bookmark) => (
                 <SavedInternshipCard
-                  key={bookmark.id}
+                  key={bookmark.internship.id}
                   bookmark={bookmark}
                   onRemove={handleRemoveBookmark}
                 />
@@ -232,9 +232,9 @@ function SavedInternshipCard({
             )}
           </div>
           
-          {internship.description && (
+          {internship.description_snippet && (
             <p className="text-sm text-gray-700 line-clamp-2">
-              {internship.description}
+              {internship.description_snippet}
             </p>
           )}
 
@@ -28,7 +28,8 @@ export interface Company {
 export interface Internship {
   id: string
   title: string
-  description?: string
+  description?: string  // full text, on the detail response only
+  description_snippet?: string  // short text for list views
   location?: string
   modality: 'remote' | 'hybrid' | 'onsite'
   field_tag: string
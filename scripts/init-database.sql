@@ -100,6 +100,27 @@ CREATE TABLE IF NOT EXISTS public.resumes (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Resume slugs are derived from the title by the database
+ALTER TABLE public.resumes ADD COLUMN IF NOT EXISTS slug TEXT
+    GENERATED ALWAYS AS (lower(regexp_replace(title, '[^a-zA-Z0-9]+', '-', 'g'))) STORED;
+
+-- Columns the API's resume list filters and sorts on
+ALTER TABLE public.resumes ADD COLUMN IF NOT EXISTS status TEXT NOT NULL DEFAULT 'draft';
+ALTER TABLE public.resumes ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE public.resumes ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE;
+
+-- List views read a short description snippet; the API fills it when a
+-- description is written, so backfill rows stored before the column existed
+-- (whitespace collapsed, cut at a word boundary to 280 characters like the API)
+ALTER TABLE public.internships ADD COLUMN IF NOT EXISTS description_snippet VARCHAR(280);
+UPDATE public.internships
+SET description_snippet = CASE
+    WHEN length(regexp_replace(btrim(description), '\s+', ' ', 'g')) <= 280
+        THEN regexp_replace(btrim(description), '\s+', ' ', 'g')
+    ELSE left(regexp_replace(left(regexp_replace(btrim(description), '\s+', ' ', 'g'), 278), ' \S*$', ''), 277) || '...'
+END
+WHERE description_snippet IS NULL AND description IS NOT NULL;
+
 -- Create bookmarks table
 CREATE TABLE IF NOT EXISTS public.bookmarks (
     id UUID DEFAULT uuid_generate_v4() PRIMARY KEY,
@@ -127,6 +148,10 @@ CREATE INDEX IF NOT EXISTS idx_internships_posting_date ON public.internships(po
 CREATE INDEX IF NOT EXISTS idx_internships_company_id ON public.internships(company_id);
 CREATE INDEX IF NOT EXISTS idx_internships_source ON public.internships(source);
 CREATE INDEX IF NOT EXISTS idx_internships_relevance_score ON public.internships(relevance_score DESC);
+CREATE INDEX IF NOT EXISTS idx_resumes_slug ON public.resumes(slug);
+-- Covers the per-user resume list (by status, newest first); soft-deleted rows are left out
+CREATE INDEX IF NOT EXISTS resumes_user_status_updated_idx ON public.resumes(user_id, status, updated_at DESC)
+    INCLUDE (title, slug, version) WHERE deleted_at IS NULL;
 
 -- Full-text search indexes
 CREATE INDEX IF NOT EXISTS idx_internships_title_search ON public.internships USING gin(to_tsvector('english', title));